@@ -11,11 +11,13 @@ import datetime
 import traceback
 import discord.utils
 
-from dciv_bot.util.cache import Cache
+from dciv_bot.util.cache import Cache, TagCache
+from dciv_bot.util.context import CustomContext
 from dciv_bot.util import mk, exceptions
 from dciv_bot.config import token, config
 from typing import Optional, Union
-from dciv_bot.util.law_helper import LawUtils
+from dciv_bot.util.law_helper import LawUtils, AnnouncementScheduler
+from dciv_bot.util.reactions import ReactionRouter
 from discord.ext import commands, tasks
 from dciv_bot.util.reddit_api import RedditAPIWrapper
 from dciv_bot.util.google_api import GoogleAPIWrapper
@@ -72,8 +74,11 @@ class DemocracivBot(commands.Bot):
 
         self.embeds = EmbedUtils()
         self.checks = CheckUtils(self)
+        self.reactions = ReactionRouter(self)
         self.laws = LawUtils(self)
+        self.announcements = AnnouncementScheduler(self)
         self.cache = Cache(self)
+        self.tag_cache = TagCache(self)
 
         # Attributes will be "initialized" in on_ready as they need a connection to Discord
         self.owner = None
@@ -183,6 +188,11 @@ class DemocracivBot(commands.Bot):
         print("[DATABASE] Successfully initialised database")
         self.db_ready = True
 
+        await self.tag_cache.build()
+
+        if config.LEGISLATURE_SEARCH_INDEX_ENABLED:
+            await self.laws.build_search_index()
+
     async def initialize_democraciv_guild(self):
         """Saves the Democraciv guild object (main guild) as a class attribute. If config.DEMOCRACIV_GUILD_ID is
         not a guild, the first guild in self.guilds will be used instead."""
@@ -246,9 +256,17 @@ class DemocracivBot(commands.Bot):
             pass
 
     async def close(self):
-        """Closes the aiohttp ClientSession, the connection pool to the PostgreSQL database and the bot itself."""
+        """Closes the aiohttp ClientSession, writes the pending tag uses, closes the connection pool to the PostgreSQL
+        database, the process pool used for law tags and the bot itself."""
         await self.session.close()
+
+        try:
+            await self.tag_cache.flush_uses()
+        except Exception as e:
+            print(f"[DATABASE] Error while saving tag uses on shutdown: {e.__class__.__name__}: {e}")
+
         await self.db.close()
+        self.laws.shutdown()
         await super().close()
 
     async def on_ready(self):
@@ -262,6 +280,17 @@ class DemocracivBot(commands.Bot):
         self.owner = (await self.application_info()).owner
         self.owner_id = self.owner.id
 
+    async def get_context(self, message, *, cls=CustomContext):
+        return await super().get_context(message, cls=cls)
+
+    async def invoke(self, ctx):
+        try:
+            await super().invoke(ctx)
+        finally:
+            # Discard every session, bill, law & motion that was loaded while this command ran
+            if isinstance(ctx, CustomContext):
+                ctx.identity_map.clear()
+
     async def on_message(self, message):
         # Don't process message/command from other bots
         if message.author.bot:
@@ -275,7 +304,17 @@ class DemocracivBot(commands.Bot):
                 break
 
         await self.cache.verify_guild_config_cache(message)
-        await self.process_commands(message)
+
+        # Parse the message only once, if it's not a command it might still be a tag
+        ctx = await self.get_context(message)
+
+        if ctx.command is None and ctx.prefix == config.BOT_PREFIX:
+            tags = self.get_cog('Tags')
+
+            if tags is not None and await tags.send_tag(message, message.content[len(ctx.prefix):]):
+                return
+
+        await self.invoke(ctx)
 
     @tasks.loop(hours=config.DATABASE_DAILY_BACKUP_INTERVAL)
     async def daily_db_backup(self):
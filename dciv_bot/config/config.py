@@ -20,6 +20,16 @@ STARBOARD_REDDIT_SUMMARY_ENABLED = True  # Toggle weekly posts to r/REDDIT_SUBRE
 STARBOARD_MIN_STARS = 5  # How many star reactions does a message need to be added to the starboard
 STARBOARD_MAX_AGE = 7  # Messages older than 7 days won't be allowed into the starboard
 STARBOARD_STAR_EMOJI = "\U00002b50"
+STARBOARD_UPDATE_DELAY = 5  # Seconds without new stars before a starboard message is sent, edited or deleted
+STARBOARD_MESSAGE_CACHE_SIZE = 1024  # How many starred messages are kept in memory to skip fetching them again
+STARBOARD_MESSAGE_CACHE_TTL = 3600  # Seconds until a cached message is fetched again, i.e. for new nicknames
+STARBOARD_BACKFILL_CONCURRENCY = 4  # How many reactions -star backfill fetches the starrers of at the same time
+
+# Legislature Configuration
+LEGISLATURE_CACHE_SIZE = 2048  # How many sessions, bills, laws & motions of closed sessions are kept in memory
+LEGISLATURE_SEARCH_INDEX_ENABLED = True  # Answer -law search from memory instead of querying the database
+LEGISLATURE_SEARCH_LIMIT = 24  # How many of the best matching laws -law search shows
+NLTK_DATA_DIR = 'dciv_bot/nltk_data/v1'  # Versioned directory with the nltk models used to generate law tags
 
 # Custom Emoji Configuration
 LEG_SUBMIT_MOTION = "<:motion:683370053508399121>"
@@ -0,0 +1,40 @@
+import asyncio
+import asyncpg
+from dciv_bot.config import token
+
+"""Fill legislature_bills.search_vector and legislature_motions.search_vector for bills and motions that were made
+before the columns and their triggers existed."""
+
+
+async def get_db():
+    return await asyncpg.create_pool(user=token.POSTGRESQL_USER,
+                                     password=token.POSTGRESQL_PASSWORD,
+                                     database=token.POSTGRESQL_DATABASE,
+                                     host=token.POSTGRESQL_HOST)
+
+
+async def main():
+    db = await get_db()
+
+    async with db.acquire() as connection:
+        async with connection.transaction():
+            await connection.execute("ALTER TABLE legislature_bills ADD COLUMN IF NOT EXISTS search_vector tsvector;")
+            await connection.execute("ALTER TABLE legislature_motions ADD COLUMN IF NOT EXISTS search_vector tsvector;")
+
+            bills = await connection.execute("""UPDATE legislature_bills SET search_vector =
+                                                    setweight(to_tsvector('english', coalesce(bill_name, '')), 'A') ||
+                                                    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+                                                WHERE search_vector IS NULL""")
+
+            motions = await connection.execute("""UPDATE legislature_motions SET search_vector =
+                                                      setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                                                      setweight(to_tsvector('english', coalesce(description, '')), 'B')
+                                                  WHERE search_vector IS NULL""")
+
+            # execute() returns the command tag, i.e. 'UPDATE 42'
+            print(f"Indexed {bills.split()[-1]} bills and {motions.split()[-1]} motions.")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    print("Migration complete.")
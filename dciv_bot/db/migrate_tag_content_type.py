@@ -0,0 +1,36 @@
+import asyncio
+import asyncpg
+from dciv_bot.config import token
+from dciv_bot.util.tag_content import get_tag_content_type
+
+"""Fill guild_tags.content_type for tags that were made before the column existed."""
+
+
+async def get_db():
+    return await asyncpg.create_pool(user=token.POSTGRESQL_USER,
+                                     password=token.POSTGRESQL_PASSWORD,
+                                     database=token.POSTGRESQL_DATABASE,
+                                     host=token.POSTGRESQL_HOST)
+
+
+async def main():
+    db = await get_db()
+
+    async with db.acquire() as connection:
+        async with connection.transaction():
+            await connection.execute("ALTER TABLE guild_tags ADD COLUMN IF NOT EXISTS content_type int;")
+            tags = await connection.fetch("SELECT id, content FROM guild_tags WHERE content_type IS NULL")
+
+            ids = [record['id'] for record in tags]
+            content_types = [get_tag_content_type(record['content'] or '').value for record in tags]
+
+            await connection.execute("""UPDATE guild_tags SET content_type = migrated.content_type
+                                        FROM unnest($1::int[], $2::int[]) AS migrated(id, content_type)
+                                        WHERE guild_tags.id = migrated.id""", ids, content_types)
+
+            print(f"Set the content type of {len(tags)} tags.")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    print("Migration complete.")
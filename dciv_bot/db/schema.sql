@@ -93,6 +93,25 @@ CREATE TABLE IF NOT EXISTS legislature_tags(
 
 CREATE INDEX IF NOT EXISTS legislature_tags_tag_trgm_idx ON legislature_tags USING gin (tag gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS legislature_bills_name_lower_idx ON legislature_bills (LOWER(bill_name));
+CREATE INDEX IF NOT EXISTS legislature_bills_name_trgm_idx ON legislature_bills USING gin (LOWER(bill_name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS legislature_bills_description_trgm_idx ON legislature_bills
+    USING gin (LOWER(description) gin_trgm_ops);
+
+-- Kept up to date by the trigger below, NULL for bills made before this column until db/migrate_search_vectors.py ran
+ALTER TABLE legislature_bills ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+CREATE OR REPLACE FUNCTION legislature_bills_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := setweight(to_tsvector('english', coalesce(NEW.bill_name, '')), 'A') ||
+                         setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS legislature_bills_search_vector_trigger ON legislature_bills;
+CREATE TRIGGER legislature_bills_search_vector_trigger BEFORE INSERT OR UPDATE OF bill_name, description
+    ON legislature_bills FOR EACH ROW EXECUTE PROCEDURE legislature_bills_search_vector_update();
+
+CREATE INDEX IF NOT EXISTS legislature_bills_search_vector_idx ON legislature_bills USING gin (search_vector);
 
 CREATE TABLE IF NOT EXISTS legislature_motions(
     id serial UNIQUE PRIMARY KEY,
@@ -103,6 +122,34 @@ CREATE TABLE IF NOT EXISTS legislature_motions(
     submitter bigint
 );
 
+CREATE INDEX IF NOT EXISTS legislature_motions_title_trgm_idx ON legislature_motions USING gin (LOWER(title) gin_trgm_ops);
+
+-- Kept up to date by the trigger below, NULL for motions made before this column until db/migrate_search_vectors.py ran
+ALTER TABLE legislature_motions ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+CREATE OR REPLACE FUNCTION legislature_motions_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                         setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS legislature_motions_search_vector_trigger ON legislature_motions;
+CREATE TRIGGER legislature_motions_search_vector_trigger BEFORE INSERT OR UPDATE OF title, description
+    ON legislature_motions FOR EACH ROW EXECUTE PROCEDURE legislature_motions_search_vector_update();
+
+CREATE INDEX IF NOT EXISTS legislature_motions_search_vector_idx ON legislature_motions USING gin (search_vector);
+
+CREATE TABLE IF NOT EXISTS announcement_outbox(
+    id serial UNIQUE PRIMARY KEY,
+    channel text,
+    queue text,
+    line text,
+    created_on timestamp WITHOUT TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS announcement_outbox_channel_idx ON announcement_outbox (channel);
+
 CREATE TABLE IF NOT EXISTS guild_tags(
     guild_id bigint references guilds(id),
     id serial UNIQUE,
@@ -128,6 +175,12 @@ CREATE TABLE IF NOT EXISTS guild_tags_alias(
 CREATE INDEX IF NOT EXISTS guild_tags_alias_alias_idx ON guild_tags_alias (alias);
 CREATE UNIQUE INDEX IF NOT EXISTS guild_tags_alias_alias_guild_id_idx ON guild_tags_alias (alias, guild_id);
 
+-- TagContentType of the tag's content, NULL until db/migrate_tag_content_type.py ran for tags made before this column
+ALTER TABLE guild_tags ADD COLUMN IF NOT EXISTS content_type int;
+
+-- Serves the LIKE '%query%' matches of -tag search
+CREATE INDEX IF NOT EXISTS guild_tags_alias_alias_trgm_idx ON guild_tags_alias USING gin (alias gin_trgm_ops);
+
 
 CREATE TABLE IF NOT EXISTS original_join_dates(
     member bigint UNIQUE,
@@ -164,4 +217,108 @@ CREATE TABLE IF NOT EXISTS starboard_starrers(
     entry_id serial references starboard_entries(id) ON DELETE CASCADE,
     starrer_id bigint,
     UNIQUE (entry_id, starrer_id)
-);
\ No newline at end of file
+);
+
+-- Precomputed starboard statistics, kept up to date by the triggers below so that '-star stats'
+-- never has to aggregate all of starboard_starrers
+
+ALTER TABLE starboard_entries ADD COLUMN IF NOT EXISTS stars int;
+ALTER TABLE starboard_entries ALTER COLUMN stars SET DEFAULT 0;
+
+-- Count the stars of entries that existed before the column, this is a no-op once every row has been counted
+UPDATE starboard_entries SET stars = (SELECT COUNT(*) FROM starboard_starrers WHERE entry_id = starboard_entries.id)
+WHERE stars IS NULL;
+
+CREATE INDEX IF NOT EXISTS starboard_entries_author_stars_idx ON starboard_entries (author_id, stars DESC);
+CREATE INDEX IF NOT EXISTS starboard_entries_posted_stars_idx ON starboard_entries (stars DESC)
+    WHERE starboard_message_id IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS starboard_stats(
+    user_id bigint PRIMARY KEY,
+    stars_received int NOT NULL DEFAULT 0,
+    stars_given int NOT NULL DEFAULT 0,
+    messages_starred int NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS starboard_stats_received_idx ON starboard_stats (stars_received DESC);
+CREATE INDEX IF NOT EXISTS starboard_stats_given_idx ON starboard_stats (stars_given DESC);
+
+-- Fill the table from the existing stars, this is a no-op once it has any rows
+INSERT INTO starboard_stats (user_id, stars_received, stars_given, messages_starred)
+SELECT counts.user_id, SUM(counts.received), SUM(counts.given), SUM(counts.starred)
+FROM (
+    SELECT entry.author_id AS user_id, COUNT(*) AS received, 0 AS given, 0 AS starred
+    FROM starboard_starrers
+    INNER JOIN starboard_entries entry ON entry.id = starboard_starrers.entry_id
+    WHERE entry.author_id IS NOT NULL
+    GROUP BY entry.author_id
+    UNION ALL
+    SELECT starrer_id, 0, COUNT(*), 0 FROM starboard_starrers GROUP BY starrer_id
+    UNION ALL
+    SELECT author_id, 0, 0, COUNT(*) FROM starboard_entries
+    WHERE starboard_message_id IS NOT NULL AND author_id IS NOT NULL
+    GROUP BY author_id
+) AS counts
+WHERE NOT EXISTS (SELECT 1 FROM starboard_stats)
+GROUP BY counts.user_id;
+
+CREATE OR REPLACE FUNCTION starboard_starrers_stats_update() RETURNS trigger AS $$
+DECLARE
+    star_author bigint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE starboard_entries SET stars = stars + 1 WHERE id = NEW.entry_id RETURNING author_id INTO star_author;
+
+        INSERT INTO starboard_stats (user_id, stars_given) VALUES (NEW.starrer_id, 1)
+        ON CONFLICT (user_id) DO UPDATE SET stars_given = starboard_stats.stars_given + 1;
+
+        IF star_author IS NOT NULL THEN
+            INSERT INTO starboard_stats (user_id, stars_received) VALUES (star_author, 1)
+            ON CONFLICT (user_id) DO UPDATE SET stars_received = starboard_stats.stars_received + 1;
+        END IF;
+
+        RETURN NEW;
+    END IF;
+
+    -- If the whole entry was deleted, star_author stays NULL since starboard_entries_stats_update()
+    -- already subtracted the entry's stars from its author
+    UPDATE starboard_entries SET stars = stars - 1 WHERE id = OLD.entry_id RETURNING author_id INTO star_author;
+    UPDATE starboard_stats SET stars_given = stars_given - 1 WHERE user_id = OLD.starrer_id;
+    UPDATE starboard_stats SET stars_received = stars_received - 1 WHERE user_id = star_author;
+    RETURN OLD;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS starboard_starrers_stats_trigger ON starboard_starrers;
+CREATE TRIGGER starboard_starrers_stats_trigger AFTER INSERT OR DELETE
+    ON starboard_starrers FOR EACH ROW EXECUTE PROCEDURE starboard_starrers_stats_update();
+
+CREATE OR REPLACE FUNCTION starboard_entries_stats_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE starboard_stats SET stars_received = stars_received - OLD.stars,
+                                   messages_starred = messages_starred - (OLD.starboard_message_id IS NOT NULL)::int
+        WHERE user_id = OLD.author_id;
+        RETURN OLD;
+    END IF;
+
+    IF (OLD.starboard_message_id IS NULL) <> (NEW.starboard_message_id IS NULL) AND NEW.author_id IS NOT NULL THEN
+        INSERT INTO starboard_stats (user_id, messages_starred)
+        VALUES (NEW.author_id, CASE WHEN NEW.starboard_message_id IS NULL THEN -1 ELSE 1 END)
+        ON CONFLICT (user_id) DO UPDATE SET messages_starred = starboard_stats.messages_starred +
+                                                               EXCLUDED.messages_starred;
+    END IF;
+
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS starboard_entries_stats_trigger ON starboard_entries;
+CREATE TRIGGER starboard_entries_stats_trigger AFTER UPDATE OF starboard_message_id OR DELETE
+    ON starboard_entries FOR EACH ROW EXECUTE PROCEDURE starboard_entries_stats_update();
+
+-- Where '-star backfill' left off in every channel, so that it can resume after a restart
+CREATE TABLE IF NOT EXISTS starboard_backfill_progress(
+    channel_id bigint PRIMARY KEY,
+    last_message_id bigint,
+    scanned_messages int NOT NULL DEFAULT 0,
+    is_finished bool NOT NULL DEFAULT FALSE
+);
@@ -4,6 +4,7 @@ import dciv_bot.util.utils as utils
 import dciv_bot.util.exceptions as exceptions
 
 from dciv_bot.util import mk
+from dciv_bot.util.chunking import chunk_message
 from discord.ext import commands
 
 
@@ -49,8 +50,9 @@ class ErrorHandler(commands.Cog):
                 await self.bot.owner.send(embed=embed)
             else:
                 await self.bot.owner.send(embed=embed)
-                if len(pretty_traceback) <= 2000:
-                    await self.bot.owner.send(f'```py\n{pretty_traceback}```')
+
+                for chunk in chunk_message(f'```py\n{pretty_traceback}```'):
+                    await self.bot.owner.send(chunk)
 
     @staticmethod
     def format_permissions(missing_perms: list) -> str:
@@ -3,6 +3,7 @@ import datetime
 import dciv_bot.util.utils as utils
 
 from dciv_bot.config import config
+from dciv_bot.util.chunking import add_embed_fields
 from discord.ext import commands
 
 
@@ -19,7 +20,8 @@ class Log(commands.Cog):
         embed = self.bot.embeds.embed_builder(title=title, description="", has_footer=False)
 
         for field in fields:
-            embed.add_field(name=field, value=fields[field][0], inline=fields[field][1])
+            if not add_embed_fields(embed, field, fields[field][0], inline=fields[field][1]):
+                embed.add_field(name=field, value="*Too long to display.*", inline=fields[field][1])
 
         if thumbnail is not None:
             embed.set_thumbnail(url=thumbnail)
@@ -52,9 +54,6 @@ class Log(commands.Cog):
             if before.embeds or after.embeds:
                 return
 
-            if len(before.content) > 1024 or len(after.content) > 1024:
-                return
-
             embed_fields = {
                 "Author": [f"{before.author.mention} {before.author}", False],
                 "Channel": [f"{before.channel.mention}", True],
@@ -78,7 +77,7 @@ class Log(commands.Cog):
                 "Channel": [f"{message.channel.mention}", False]
             }
 
-            if message.content and len(message.content) <= 1024:
+            if message.content:
                 embed_fields['Message'] = [message.content, False]
 
             await self.log_event(message.guild, ':wastebasket:  Message Deleted', embed_fields)
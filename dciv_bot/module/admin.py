@@ -28,11 +28,27 @@ class Admin(JishakuBase, metaclass=GroupCogMeta, command_parent=jsk, command_att
         else:
             await ctx.send(result)
 
+    @commands.command(name='cacheinfo')
+    @commands.is_owner()
+    async def cacheinfo(self, ctx):
+        """Hits and misses of the cache for sessions, bills, laws & motions of closed sessions"""
+
+        info = self.bot.laws.cache_info()
+        lookups = info.hits + info.misses
+        hit_rate = f"{info.hits / lookups:.1%}" if lookups else "-"
+
+        await ctx.send(f"```Hits: {info.hits}\nMisses: {info.misses}\nHit rate: {hit_rate}\n"
+                       f"Size: {info.currsize}/{info.maxsize}```")
+
     @commands.command(name='addlawtag', aliases=['lt'])
     @commands.is_owner()
     async def lawtag(self, ctx, law: Law, tag: str):
         """Add a search tag to a law to be used in `-laws search`"""
         await self.bot.db.execute("INSERT INTO legislature_tags (id, tag) VALUES ($1, $2)", law.id, tag.lower())
+        self.bot.laws.invalidate(Law, law.id)
+
+        if self.bot.laws.search_index is not None:
+            self.bot.laws.search_index.add_tags(law.id, [tag])
         await ctx.send(f":white_check_mark: `{tag}` was added as a search tag to `{law.bill.name}` (#{law.id})")
 
 
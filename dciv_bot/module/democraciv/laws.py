@@ -17,25 +17,21 @@ from dciv_bot.util.converter import Law, CaseInsensitiveMember, PoliticalParty
 
 class RepealScheduler(AnnouncementQueue):
 
-    def get_message(self) -> str:
-        message = [f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.GOVERNMENT_ROLE).mention}, "
-                   f"the following laws were **repealed**.\n"]
+    def get_header(self) -> str:
+        return f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.GOVERNMENT_ROLE).mention}, " \
+               f"the following laws were **repealed**.\n"
 
-        for obj in self._objects:
-            message.append(f"-  **{obj.bill.name}** (<{obj.bill.tiny_link}>)")
-
-        return '\n'.join(message)
+    def format_object(self, obj: Law) -> str:
+        return f"-  **{obj.bill.name}** (<{obj.bill.tiny_link}>)"
 
 
 class AmendScheduler(AnnouncementQueue):
 
-    def get_message(self) -> str:
-        message = [f"The links to the following laws were changed by the {self.bot.mk.LEGISLATURE_CABINET_NAME}.\n"]
-
-        for obj in self._objects:
-            message.append(f"-  **{obj.bill.name}** (<{obj.bill.tiny_link}>)")
+    def get_header(self) -> str:
+        return f"The links to the following laws were changed by the {self.bot.mk.LEGISLATURE_CABINET_NAME}.\n"
 
-        return '\n'.join(message)
+    def format_object(self, obj: Law) -> str:
+        return f"-  **{obj.bill.name}** (<{obj.bill.tiny_link}>)"
 
 
 class Laws(commands.Cog, name='Law'):
@@ -45,8 +41,6 @@ class Laws(commands.Cog, name='Law'):
         self.bot: DemocracivBot = bot
         self.repeal_scheduler = RepealScheduler(bot, mk.DemocracivChannel.GOV_ANNOUNCEMENTS_CHANNEL)
         self.amend_scheduler = AmendScheduler(bot, mk.DemocracivChannel.GOV_ANNOUNCEMENTS_CHANNEL)
-        self.illegal_tags = ('act', 'the', 'author', 'authors', 'date',
-                             'name', 'bill', 'law', 'and', 'd/m/y', 'type', 'description')
 
     @property
     def gov_announcements_channel(self) -> typing.Optional[discord.TextChannel]:
@@ -252,27 +246,12 @@ class Laws(commands.Cog, name='Law'):
             return await ctx.send(":x: The query to search for must be at least 3 characters.")
 
         async with ctx.typing():
+            results = await self.bot.laws.search_laws(name)
 
-            # First, search by name similarity
-            async with self.bot.db.acquire() as con:
-                results = await self.bot.laws.search_law_by_name(name, connection=con)
-
-                # Set word similarity threshold for search by tag
-                await self.bot.laws.update_pg_trgm_similarity_threshold(0.4, connection=con)
-
-                # Then, search by tag similarity
-                for substring in query:
-                    if len(substring) < 3 or substring in self.illegal_tags:
-                        continue
+            if not results:
+                results = ['Nothing found.']
 
-                    result = await self.bot.laws.search_law_by_tag(substring, connection=con)
-                    if result:
-                        results.update(result)
-
-                if not results:
-                    results = ['Nothing found.']
-
-        pages = AlternativePages(ctx=ctx, entries=list(results), show_entry_count=False,
+        pages = AlternativePages(ctx=ctx, entries=results, show_entry_count=False,
                                  title=f"{self.bot.mk.NATION_EMOJI}  Laws matching '{name}'",
                                  show_index=False, show_amount_of_pages=True)
         await pages.paginate()
@@ -308,8 +287,9 @@ class Laws(commands.Cog, name='Law'):
             return await ctx.send("Aborted.")
 
         elif reaction:
+            await Law.repeal_many(self.bot, laws)
+
             for law in laws:
-                await law.repeal()
                 self.repeal_scheduler.add(law)
 
             return await ctx.send(f":white_check_mark: All laws were repealed.")
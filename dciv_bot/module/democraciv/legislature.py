@@ -12,38 +12,39 @@ from dciv_bot.util import mk, exceptions, utils
 from discord.ext.commands import Greedy
 from dciv_bot.util.paginator import AlternativePages
 from dciv_bot.util.law_helper import AnnouncementQueue
+from dciv_bot.util.chunking import add_embed_fields
 from dciv_bot.util.converter import Session, SessionStatus, Bill, Motion, Law, CaseInsensitiveMember, PoliticalParty, BillStatus
 
 
 class PassScheduler(AnnouncementQueue):
 
-    def get_message(self) -> str:
-        message = [f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.MINISTER_ROLE).mention}, "
-                   f"the following bills were **passed by the {self.bot.mk.LEGISLATURE_NAME}**.\n"]
+    def get_header(self) -> str:
+        return f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.MINISTER_ROLE).mention}, " \
+               f"the following bills were **passed by the {self.bot.mk.LEGISLATURE_NAME}**.\n"
 
-        for obj in self._objects:
-            if obj.is_vetoable:
-                message.append(f"-  **{obj.name}** (<{obj.tiny_link}>)")
-            else:
-                message.append(f"-  __**{obj.name}**__ (<{obj.tiny_link}>)")
+    def format_object(self, obj: Bill) -> str:
+        if obj.is_vetoable:
+            return f"-  **{obj.name}** (<{obj.tiny_link}>)"
+
+        return f"-  __**{obj.name}**__ (<{obj.tiny_link}>)"
 
-        message.append(f"\nAll non-vetoable bills are now laws (marked as __underlined__), "
-                       f"the others were sent to the {self.bot.mk.MINISTRY_NAME}.")
-        return '\n'.join(message)
+    def get_footer(self) -> str:
+        return f"All non-vetoable bills are now laws (marked as __underlined__), " \
+               f"the others were sent to the {self.bot.mk.MINISTRY_NAME}."
 
 
 class OverrideScheduler(AnnouncementQueue):
 
-    def get_message(self) -> str:
-        message = [f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.GOVERNMENT_ROLE).mention}, "
-                   f"the {self.bot.mk.MINISTRY_NAME}'s **veto of the following bills were overridden** "
-                   f"by the {self.bot.mk.LEGISLATURE_NAME}.\n"]
+    def get_header(self) -> str:
+        return f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.GOVERNMENT_ROLE).mention}, " \
+               f"the {self.bot.mk.MINISTRY_NAME}'s **veto of the following bills were overridden** " \
+               f"by the {self.bot.mk.LEGISLATURE_NAME}.\n"
 
-        for obj in self._objects:
-            message.append(f"-  **{obj.name}** (<{obj.tiny_link}>)")
+    def format_object(self, obj: Bill) -> str:
+        return f"-  **{obj.name}** (<{obj.tiny_link}>)"
 
-        message.append("\nAll of the above bills are now law.")
-        return '\n'.join(message)
+    def get_footer(self) -> str:
+        return "All of the above bills are now law."
 
 
 class Legislature(commands.Cog):
@@ -98,7 +99,7 @@ class Legislature(commands.Cog):
     async def legislature(self, ctx):
         """Dashboard for Legislators with important links and the status of the current session"""
 
-        active_leg_session = await self.bot.laws.get_active_leg_session()
+        active_leg_session = await self.bot.laws.get_active_leg_session(ctx)
 
         if active_leg_session is None:
             current_session_value = "There currently is no open session."
@@ -140,8 +141,7 @@ class Legislature(commands.Cog):
 
             pretty = []
 
-            for record in all_bills:
-                _bill = await Bill.convert(ctx, record['id'])
+            for _bill in await Bill.convert_many(ctx, [record['id'] for record in all_bills]):
                 pretty.append(f"Bill #{_bill.id} - [{_bill.name}]({_bill.link}) "
                               f"{await _bill.get_emojified_status(verbose=False)}")
 
@@ -193,16 +193,19 @@ class Legislature(commands.Cog):
         if len(query) < 3:
             return await ctx.send(":x: The query to search for has to be at least 3 characters long.")
 
+        # Both conditions are backed by an index, see legislature_bills_search_vector_idx and
+        # legislature_bills_name_trgm_idx in schema.sql
         sql_query = """SELECT id from legislature_bills
-                   WHERE (lower(bill_name) LIKE '%' || $1 || '%') OR (lower(description) LIKE '%' || $1 || '%')
-                   ORDER BY similarity(lower(bill_name), $1) DESC
-                   LIMIT 20"""
+                       WHERE search_vector @@ plainto_tsquery('english', $1)
+                       OR lower(bill_name) LIKE '%' || $1 || '%'
+                       ORDER BY ts_rank(search_vector, plainto_tsquery('english', $1))
+                                + similarity(lower(bill_name), $1) DESC
+                       LIMIT 20"""
 
         found_bills = await self.bot.db.fetch(sql_query, query.lower())
         pretty = []
 
-        for record in found_bills:
-            _bill = await Bill.convert(ctx, record['id'])
+        for _bill in await Bill.convert_many(ctx, [record['id'] for record in found_bills]):
             pretty.append(f"Bill #{_bill.id} - [{_bill.name}]({_bill.link}) "
                           f"{await _bill.get_emojified_status(verbose=False)}")
 
@@ -242,8 +245,7 @@ class Legislature(commands.Cog):
 
         pretty = []
 
-        for record in bills_from_person:
-            _bill = await Bill.convert(ctx, record['id'])
+        for _bill in await Bill.convert_many(ctx, [record['id'] for record in bills_from_person]):
             pretty.append(f"Bill #{_bill.id} - [{_bill.name}]({_bill.link}) "
                           f"{await _bill.get_emojified_status(verbose=False)}")
 
@@ -363,15 +365,16 @@ class Legislature(commands.Cog):
             return await ctx.send(":x: The query to search for has to be at least 3 characters long.")
 
         sql_query = """SELECT id from legislature_motions
-                       WHERE (lower(title) LIKE '%' || $1 || '%') OR (lower(description) LIKE '%' || $1 || '%')
-                       ORDER BY similarity(lower(title), $1) DESC
+                       WHERE search_vector @@ plainto_tsquery('english', $1)
+                       OR lower(title) LIKE '%' || $1 || '%'
+                       ORDER BY ts_rank(search_vector, plainto_tsquery('english', $1))
+                                + similarity(lower(title), $1) DESC
                        LIMIT 20"""
 
         found_motions = await self.bot.db.fetch(sql_query, query.lower())
         pretty = []
 
-        for record in found_motions:
-            _motion = await Motion.convert(ctx, record['id'])
+        for _motion in await Motion.convert_many(ctx, [record['id'] for record in found_motions]):
             pretty.append(f"Motion #{_motion.id} - [{_motion.title}]({_motion.link})")
 
         pretty = pretty or ["Nothing found."]
@@ -387,7 +390,7 @@ class Legislature(commands.Cog):
     async def opensession(self, ctx):
         """Opens a session for the submission period to begin"""
 
-        active_leg_session = await self.bot.laws.get_active_leg_session()
+        active_leg_session = await self.bot.laws.get_active_leg_session(ctx)
 
         if active_leg_session is not None:
             return await ctx.send(f":x: There is still an open session, close session #{active_leg_session.id} first!")
@@ -396,6 +399,9 @@ class Legislature(commands.Cog):
             'INSERT INTO legislature_sessions (speaker, is_active, opened_on)'
             'VALUES ($1, true, $2) RETURNING id', ctx.author.id, datetime.datetime.utcnow())
 
+        if self.bot.laws.statistics is not None:
+            self.bot.laws.statistics.session_opened(ctx.author.id)
+
         await ctx.send(f":white_check_mark: The **submission period** for session #{new_session} was opened.")
 
         await self.gov_announcements_channel.send(f"The **submission period** for Legislative Session "
@@ -421,7 +427,7 @@ class Legislature(commands.Cog):
         if not self.bot.laws.is_google_doc_link(voting_form):
             return await ctx.send(":x: That doesn't look like a Google Docs URL.")
 
-        active_leg_session: Session = await self.bot.laws.get_active_leg_session()
+        active_leg_session: Session = await self.bot.laws.get_active_leg_session(ctx)
 
         if active_leg_session is None:
             return await ctx.send(":x: There is no open session.")
@@ -449,7 +455,7 @@ class Legislature(commands.Cog):
     async def closesession(self, ctx):
         """Closes the current session"""
 
-        active_leg_session = await self.bot.laws.get_active_leg_session()
+        active_leg_session = await self.bot.laws.get_active_leg_session(ctx)
 
         if active_leg_session is None:
             return await ctx.send(f":x: There is no open session.")
@@ -475,42 +481,29 @@ class Legislature(commands.Cog):
         if isinstance(session, str):
             return
 
-        session = session or await self.bot.laws.get_last_leg_session()
+        session = session or await self.bot.laws.get_last_leg_session(ctx, prefetch=True)
 
         if session is None:
             return await ctx.send(":x: There hasn't been a session yet.")
 
         async with ctx.typing():
-            b_ids = list()
-            b_hyperlinks = list()
-
-            m_ids = list()
-            m_hyperlinks = list()
-
-            for bill_id in session.bills:
-                bill = await Bill.convert(ctx, bill_id)
-                b_ids.append(f"Bill #{bill.id}")
-                b_hyperlinks.append(f'=HYPERLINK("{bill.link}"; "{bill.name}")')
-
-            for motion_id in session.motions:
-                motion = await Motion.convert(ctx, motion_id)
-                m_ids.append(f"Motion #{motion.id}")
-                m_hyperlinks.append(f'=HYPERLINK("{motion.link}"; "{motion.name}")')
-
-            exported = [
-                f"Export of Legislative Session {session.id} -- {datetime.datetime.utcnow().strftime('%c')}\n\n\n",
-                f"Xth Session - {session.opened_on.strftime('%B %d %Y')} (Bot Session {session.id})\n\n"
-                "----- Submitted Bills -----\n"]
-
-            exported.extend(b_ids)
-            exported.append("\n")
-            exported.extend(b_hyperlinks)
-            exported.append("\n\n----- Submitted Motions -----\n")
-            exported.extend(m_ids)
-            exported.append("\n")
-            exported.extend(m_hyperlinks)
-
-            link = await self.bot.laws.post_to_hastebin('\n'.join(exported))
+            # Both the export and the voting form are generated from these, so every bill & motion is only loaded once
+            bills = await Bill.convert_many(ctx, await session.bills)
+            motions = await Motion.convert_many(ctx, await session.motions)
+
+            def export_lines():
+                yield f"Export of Legislative Session {session.id} -- {datetime.datetime.utcnow().strftime('%c')}\n\n\n"
+                yield f"Xth Session - {session.opened_on.strftime('%B %d %Y')} (Bot Session {session.id})\n\n" \
+                      "----- Submitted Bills -----\n"
+                yield from (f"Bill #{bill.id}" for bill in bills)
+                yield "\n"
+                yield from (f'=HYPERLINK("{bill.link}"; "{bill.name}")' for bill in bills)
+                yield "\n\n----- Submitted Motions -----\n"
+                yield from (f"Motion #{motion.id}" for motion in motions)
+                yield "\n"
+                yield from (f'=HYPERLINK("{motion.link}"; "{motion.name}")' for motion in motions)
+
+            link = await self.bot.laws.post_to_hastebin(export_lines())
             text = f"**__Export of Legislative Session #{session.id}__**\nSee the video below to see how to speed up " \
                    f"your Speaker duties with this command.\n\n**Export:** <{link}>\n\n" \
                    "https://cdn.discordapp.com/attachments/709411002482950184/709412385034862662/howtoexport.mp4"
@@ -546,12 +539,13 @@ class Legislature(commands.Cog):
                            f"\n:arrows_counterclockwise: This may take a few minutes...")
 
             async with ctx.typing():
-                bills = {b.name: b.link for b in [await Bill.convert(ctx, _b) for _b in session.bills]}
-                motions = {m.name: m.link for m in [await Motion.convert(ctx, _m) for _m in session.motions]}
+                form_bills = {b.name: b.link for b in bills}
+                form_motions = {m.name: m.link for m in motions}
 
                 result = await self.bot.google_api.run_apps_script(script_id="MME1GytLY6YguX02rrXqPiGqnXKElby-M",
                                                                    function="generate_form",
-                                                                   parameters=[form_url, session.id, bills, motions])
+                                                                   parameters=[form_url, session.id, form_bills,
+                                                                               form_motions])
 
                 if result is None or not result['done']:
                     ctx.command.reset_cooldown(ctx)
@@ -626,25 +620,6 @@ class Legislature(commands.Cog):
 
         return '\n'.join(formatted_time)
 
-    @staticmethod
-    def split_embed_fields(things: str) -> typing.Dict[int, str]:
-        lines = things.splitlines(keepends=True)
-        split_into_1024 = dict()
-        index = 0
-
-        for paragraph in lines:
-            try:
-                split_into_1024[index]
-            except KeyError:
-                split_into_1024[index] = ""
-
-            split_into_1024[index] = split_into_1024[index] + ''.join(paragraph)
-
-            if (len(''.join(split_into_1024[index]))) > 924:
-                index += 1
-
-        return split_into_1024
-
     @legislature.command(name='session', aliases=['s'])
     @commands.cooldown(1, config.BOT_COMMAND_COOLDOWN, commands.BucketType.user)
     async def session(self, ctx, session: Session = None):
@@ -661,25 +636,31 @@ class Legislature(commands.Cog):
 
         # User invoked -legislature session without arguments
         elif session is None:
-            session = await self.bot.laws.get_last_leg_session()
+            session = await self.bot.laws.get_last_leg_session(ctx, prefetch=True)
 
             if session is None:
                 return await ctx.send(":x: There hasn't been a session yet.")
 
-        if len(session.motions) > 0:
+        motions = await Motion.convert_many(ctx, await session.motions)
+        bills = await Bill.convert_many(ctx, await session.bills)
+
+        if len(motions) > 0:
             pretty_motions = []
-            for motion_id in session.motions:
-                motion = await Motion.convert(ctx, motion_id)
+            for motion in motions:
                 pretty_motions.append(f"Motion #{motion.id} - [{motion.short_name}]({motion.link})")
         else:
             pretty_motions = ["-"]
 
-        if len(session.bills) > 0:
+        if len(bills) > 0:
             pretty_bills = []
 
-            for bill_id in session.bills:
-                bill = await Bill.convert(ctx, bill_id)
-                if await bill.is_law():
+            # Look up which bills are laws with one query instead of calling Bill.is_law() for every bill
+            laws = await self.bot.db.fetch("SELECT bill_id FROM legislature_laws WHERE bill_id = ANY($1::int[])",
+                                           [bill.id for bill in bills])
+            law_bill_ids = {record['bill_id'] for record in laws}
+
+            for bill in bills:
+                if bill.id in law_bill_ids:
                     pretty_bills.append(f"__Bill #{bill.id}__ - [{bill.short_name}]({bill.tiny_link})")
                 else:
                     pretty_bills.append(f"Bill #{bill.id} - [{bill.short_name}]({bill.tiny_link})")
@@ -702,42 +683,20 @@ class Legislature(commands.Cog):
         pretty_motions = '\n'.join(pretty_motions)
         pretty_bills = '\n'.join(pretty_bills)
 
-        if len(pretty_motions) <= 1024:
-            embed.add_field(name="Submitted Motions", value=pretty_motions, inline=False)
-        else:
-            fields = self.split_embed_fields(pretty_motions)
-
-            for index in fields:
-                if index == 0:
-                    embed.add_field(name="Submitted Motions", value=fields[index], inline=False)
-                else:
-                    embed.add_field(name="Submitted Motions (cont.)", value=fields[index], inline=False)
-
-        if len(pretty_bills) <= 1024:
-            embed.add_field(name="Submitted Bills", value=pretty_bills, inline=False)
-        else:
-            fields = self.split_embed_fields(pretty_bills)
-
-            for index in fields:
-                if index == 0:
-                    embed.add_field(name="Submitted Bills", value=fields[index], inline=False)
-                else:
-                    embed.add_field(name="Submitted Bills (cont.)", value=fields[index], inline=False)
-
-        if len(embed) > 6000:
-            for _ in embed.fields:
-                embed.remove_field(4)
+        embed.set_footer(text="Bills that are underlined are active laws. All times are in UTC.")
 
+        if not add_embed_fields(embed, "Submitted Motions", pretty_motions):
             async with ctx.typing():
                 haste_bin_url = await self.bot.laws.post_to_hastebin(pretty_motions)
                 too_long = f"This text was too long for Discord, so I put it on [here.]({haste_bin_url})"
                 embed.add_field(name="Submitted Motions", value=too_long, inline=False)
 
+        if not add_embed_fields(embed, "Submitted Bills", pretty_bills):
+            async with ctx.typing():
                 haste_bin_url = await self.bot.laws.post_to_hastebin(pretty_bills)
                 too_long_ = f"This text was too long for Discord, so I put it on [here.]({haste_bin_url})"
                 embed.add_field(name="Submitted Bills", value=too_long_, inline=False)
 
-        embed.set_footer(text="Bills that are underlined are active laws. All times are in UTC.")
         await ctx.send(embed=embed)
 
     async def submit_bill(self, ctx, current_leg_session_id: int) -> typing.Tuple[typing.Optional[str],
@@ -813,6 +772,9 @@ class Legislature(commands.Cog):
                 await ctx.send(":x: A bill with the same exact Google Docs Document was already submitted!")
                 return None, None
 
+            if self.bot.laws.statistics is not None:
+                self.bot.laws.statistics.bill_submitted(ctx.author.id)
+
             message = "Hey! A new **bill** was just submitted."
             embed = self.bot.embeds.embed_builder(title="Bill Submitted", description="", time_stamp=True)
             embed.add_field(name="Title", value=bill_title, inline=False)
@@ -864,6 +826,9 @@ class Legislature(commands.Cog):
                 "VALUES ($1, $2, $3, $4, $5)",
                 current_leg_session_id, title, description, ctx.author.id, haste_bin_url)
 
+            if self.bot.laws.statistics is not None:
+                self.bot.laws.statistics.motion_submitted()
+
             message = "Hey! A new **motion** was just submitted."
             embed = self.bot.embeds.embed_builder(title="Motion Submitted", description="", time_stamp=True)
             embed.add_field(name="Title", value=title, inline=False)
@@ -890,7 +855,7 @@ class Legislature(commands.Cog):
         if self.speaker is None:
             raise exceptions.NoOneHasRoleError(mk.DemocracivRole.SPEAKER_ROLE.printable_name)
 
-        current_leg_session: Session = await self.bot.laws.get_active_leg_session()
+        current_leg_session: Session = await self.bot.laws.get_active_leg_session(ctx)
 
         if current_leg_session is None:
             return await ctx.send(":x: There is no active session.")
@@ -912,7 +877,7 @@ class Legislature(commands.Cog):
         if not reaction:
             return
 
-        if str(reaction.emoji) == config.LEG_SUBMIT_BILL:
+        if str(reaction) == config.LEG_SUBMIT_BILL:
 
             if not self.bot.mk.LEGISLATURE_EVERYONE_ALLOWED_TO_SUBMIT_BILLS:
                 if self.legislator_role not in ctx.author.roles:
@@ -921,7 +886,7 @@ class Legislature(commands.Cog):
 
             message, embed = await self.submit_bill(ctx, current_leg_session.id)
 
-        elif str(reaction.emoji) == config.LEG_SUBMIT_MOTION:
+        elif str(reaction) == config.LEG_SUBMIT_MOTION:
             ctx.command.reset_cooldown(ctx)
 
             if not self.bot.mk.LEGISLATURE_EVERYONE_ALLOWED_TO_SUBMIT_MOTIONS:
@@ -958,7 +923,7 @@ class Legislature(commands.Cog):
             return await ctx.send_help(ctx.command)
 
         bills = bill_ids
-        last_leg_session: Session = await self.bot.laws.get_last_leg_session()
+        last_leg_session: Session = await self.bot.laws.get_last_leg_session(ctx)
         flow = Flow(self.bot, ctx)
 
         async def verify_bill(_bill: Bill, last_session: Session) -> typing.Optional[str]:
@@ -968,7 +933,7 @@ class Legislature(commands.Cog):
             if last_session.status is not SessionStatus.CLOSED:
                 return "You cannot mark bills as passed while their session is still in Submission or Voting Period."
 
-            if _bill.status is not BillStatus.SUBMITTED or _bill.status is not BillStatus.LEG_FAILED:
+            if _bill.status not in (BillStatus.SUBMITTED, BillStatus.LEG_FAILED):
                 return "You already voted on this bill."
 
         error_messages = []
@@ -1006,12 +971,9 @@ class Legislature(commands.Cog):
 
         elif reaction:
             async with ctx.typing():
-                for _bill in bills:
-                    await _bill.pass_from_legislature()
-
-                    if not _bill.is_vetoable:
-                        await _bill.pass_into_law()
+                await Bill.pass_many_from_legislature(self.bot, bills)
 
+                for _bill in bills:
                     self.scheduler.add(_bill)
 
                 await ctx.send(f":white_check_mark: All bills were marked as passed from "
@@ -1034,7 +996,7 @@ class Legislature(commands.Cog):
         else:
             obj_name = "motion"
 
-        last_leg_session = await self.bot.laws.get_last_leg_session()
+        last_leg_session = await self.bot.laws.get_last_leg_session(ctx)
 
         def verify_object(to_verify) -> str:
             if not to_verify.session.is_active:
@@ -1195,9 +1157,11 @@ class Legislature(commands.Cog):
             return await ctx.send("Aborted.")
 
         elif reaction:
-            for bill in bills:
-                await bill.pass_into_law(override=True)
-                self.override_scheduler.add(bill)
+            async with ctx.typing():
+                await Bill.pass_many_into_law(self.bot, bills, override=True)
+
+                for bill in bills:
+                    self.override_scheduler.add(bill)
 
             await ctx.send(f":white_check_mark: The vetos of all bills were overridden.")
 
@@ -15,30 +15,28 @@ from dciv_bot.util.law_helper import AnnouncementQueue
 
 class LawPassScheduler(AnnouncementQueue):
 
-    def get_message(self) -> str:
-        message = [f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.GOVERNMENT_ROLE).mention}, "
-                   f"the following bills were **passed into law by the {self.bot.mk.MINISTRY_NAME}**.\n"]
+    def get_header(self) -> str:
+        return f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.GOVERNMENT_ROLE).mention}, " \
+               f"the following bills were **passed into law by the {self.bot.mk.MINISTRY_NAME}**.\n"
 
-        for obj in self._objects:
-            message.append(f"-  **{obj.name}** (<{obj.tiny_link}>)")
+    def format_object(self, obj: Bill) -> str:
+        return f"-  **{obj.name}** (<{obj.tiny_link}>)"
 
-        message.append(f"\nAll new laws were added to `{config.BOT_PREFIX}laws` and can now be found with "
-                       f"`{config.BOT_PREFIX}laws search <query>`. The "
-                       f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.SPEAKER_ROLE).mention} should add them to "
-                       f"the Legal Code as soon as possible.")
-        return '\n'.join(message)
+    def get_footer(self) -> str:
+        return f"All new laws were added to `{config.BOT_PREFIX}laws` and can now be found with " \
+               f"`{config.BOT_PREFIX}laws search <query>`. The " \
+               f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.SPEAKER_ROLE).mention} should add them to " \
+               f"the Legal Code as soon as possible."
 
 
 class LawVetoScheduler(AnnouncementQueue):
 
-    def get_message(self) -> str:
-        message = [f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.SPEAKER_ROLE).mention}, "
-                   f"the following bills were **vetoed by the {self.bot.mk.MINISTRY_NAME}**.\n"]
+    def get_header(self) -> str:
+        return f"{mk.get_democraciv_role(self.bot, mk.DemocracivRole.SPEAKER_ROLE).mention}, " \
+               f"the following bills were **vetoed by the {self.bot.mk.MINISTRY_NAME}**.\n"
 
-        for obj in self._objects:
-            message.append(f"-  **{obj.name}** (<{obj.tiny_link}>)")
-
-        return '\n'.join(message)
+    def format_object(self, obj: Bill) -> str:
+        return f"-  **{obj.name}** (<{obj.tiny_link}>)"
 
 
 class Ministry(commands.Cog):
@@ -222,8 +220,9 @@ class Ministry(commands.Cog):
 
         elif reaction:
             async with ctx.typing():
+                await Bill.veto_many(self.bot, bills)
+
                 for _bill in bills:
-                    await _bill.veto()
                     self.veto_scheduler.add(_bill)
 
                 await ctx.send(":white_check_mark: All bills were vetoed.")
@@ -275,8 +274,9 @@ class Ministry(commands.Cog):
 
         elif reaction:
             async with ctx.typing():
+                await Bill.pass_many_into_law(self.bot, bills)
+
                 for bill in bills:
-                    await bill.pass_into_law()
                     self.pass_scheduler.add(bill)
 
                 await ctx.send(":white_check_mark: All bills were passed into law.")
@@ -7,6 +7,7 @@ from discord.ext import commands
 from dciv_bot.config import config
 from dciv_bot.util import mk, exceptions, utils
 from dciv_bot.util.converter import PoliticalParty
+from dciv_bot.util.chunking import add_embed_fields
 from dciv_bot.util.exceptions import ForbiddenTask
 
 
@@ -69,21 +70,8 @@ class Party(commands.Cog, name='Political Parties'):
 
         party_members = '\n'.join([f"{member.mention} {member}" for member in party.role.members]) or '-'
 
-        if len(party_members) <= 1024:
-            embed.add_field(name=f"Members ({len(party.role.members)})", value=party_members, inline=False)
-        else:
-            fields = self.bot.get_cog("Legislature").split_embed_fields(party_members)
-
-            for index in fields:
-                if index == 0:
-                    embed.add_field(name=f"Members ({len(party.role.members)})", value=fields[index], inline=False)
-                else:
-                    embed.add_field(name="Members (Cont.)", value=fields[index], inline=False)
-
-        if len(embed) > 6000:
-            for _ in embed.fields:
-                embed.remove_field(len(embed.fields) - 1)
-
+        if not add_embed_fields(embed, f"Members ({len(party.role.members)})", party_members,
+                                continued_name="Members (Cont.)"):
             embed.add_field(name=f"Members ({len(party.role.members)})", value="*Too long to display.*", inline=False)
 
         await ctx.send(embed=embed)
@@ -9,6 +9,7 @@ import xdice
 from dciv_bot.config import config
 from discord.ext import commands
 from dciv_bot.util.paginator import AlternativePages
+from dciv_bot.util.chunking import add_embed_fields
 from dciv_bot.util.converter import CaseInsensitiveRole, PoliticalParty, CaseInsensitiveMember
 
 
@@ -338,21 +339,8 @@ class Misc(commands.Cog, name="Miscellaneous"):
         embed.add_field(name="Created on", value=role.created_at.strftime("%B %d, %Y"), inline=True)
         embed.add_field(name="Colour", value=str(role.colour), inline=True)
 
-        if len(role_members) <= 1024:
-            embed.add_field(name=f"Members ({len(role.members)})", value=role_members, inline=False)
-        else:
-            fields = self.bot.get_cog("Legislature").split_embed_fields(role_members)
-
-            for index in fields:
-                if index == 0:
-                    embed.add_field(name=f"Members ({len(role.members)})", value=fields[index], inline=False)
-                else:
-                    embed.add_field(name="Members (Cont.)", value=fields[index], inline=False)
-
-        if len(embed) > 6000:
-            for _ in embed.fields:
-                embed.remove_field(4)
-
+        if not add_embed_fields(embed, f"Members ({len(role.members)})", role_members,
+                                continued_name="Members (Cont.)"):
             embed.add_field(name=f"Members ({len(role.members)})", value="*Too long to display.*", inline=False)
 
         await ctx.send(embed=embed)
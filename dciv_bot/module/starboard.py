@@ -32,9 +32,83 @@ from dciv_bot.util import mk
 from dciv_bot.config import token, config
 from discord.ext import commands, tasks
 
+from dciv_bot.util.cache import LRUCache
 from dciv_bot.util.converter import CaseInsensitiveMember
 
 
+class MessageSnapshot(typing.NamedTuple):
+    """The parts of a discord.Message that the Starboard needs, so that repeated reactions on the same message don't
+    have to fetch it from the API again"""
+
+    id: int
+    channel_id: int
+    guild_id: int
+    author_id: int
+    author_name: str
+    author_avatar_url: str
+    content: str
+    clean_content: str
+    created_at: datetime.datetime
+    jump_url: str
+    image_url: typing.Optional[str]
+    attachment: typing.Optional[typing.Tuple[str, str]]  # (filename, url) of an attachment that is no image
+    is_starrable: bool
+
+    @classmethod
+    def from_message(cls, message: discord.Message):
+        image_url = None
+        attachment = None
+
+        if message.embeds:
+            data = message.embeds[0]
+            if data.type == 'image':
+                image_url = data.url
+
+        if message.attachments:
+            file = message.attachments[0]
+            if file.url.lower().endswith(('png', 'jpeg', 'jpg', 'gif', 'webp')):
+                image_url = file.url
+            else:
+                attachment = (file.filename, file.url)
+
+        is_starrable = bool(message.content or message.attachments) and message.type is discord.MessageType.default
+
+        return cls(id=message.id, channel_id=message.channel.id, guild_id=message.guild.id,
+                   author_id=message.author.id, author_name=message.author.display_name,
+                   author_avatar_url=str(message.author.avatar_url_as(static_format='png')),
+                   content=message.content, clean_content=message.clean_content, created_at=message.created_at,
+                   jump_url=message.jump_url, image_url=image_url, attachment=attachment, is_starrable=is_starrable)
+
+
+class StarEntry:
+    """In-memory state of a starred message. The set of starrers is authoritative, changes to it are written to
+    starboard_starrers in batches by Starboard.flush_starrers."""
+
+    __slots__ = ('id', 'message_id', 'created_at', 'starboard_message_id', 'starrers', 'message', 'posted_stars',
+                 'update_at', 'update_task')
+
+    def __init__(self, record: asyncpg.Record, created_at: datetime.datetime):
+        self.id: int = record['id']
+        self.message_id: int = record['message_id']
+        self.created_at = created_at
+        self.starboard_message_id: typing.Optional[int] = record['starboard_message_id']
+        self.starrers: typing.Set[int] = set(record['starrers'])
+
+        # The starred message and the star amount shown on the starboard, used by the debounced embed update
+        self.message: typing.Optional[MessageSnapshot] = None
+        self.posted_stars: typing.Optional[int] = None
+        self.update_at: float = 0
+        self.update_task: typing.Optional[asyncio.Task] = None
+
+    @property
+    def is_updating(self) -> bool:
+        return self.update_task is not None and not self.update_task.done()
+
+    @property
+    def stars(self) -> int:
+        return len(self.starrers)
+
+
 class Starboard(commands.Cog):
     """The Starboard. If a message on the Democraciv Server has at least n :star: reactions,
     it will be posted to the Starboard channel and in a weekly summary to the subreddit every Saturday."""
@@ -44,6 +118,23 @@ class Starboard(commands.Cog):
         self.star_emoji = config.STARBOARD_STAR_EMOJI
         self.star_threshold = config.STARBOARD_MIN_STARS
 
+        # message_id -> MessageSnapshot of recently reacted to messages
+        self._messages = LRUCache(config.STARBOARD_MESSAGE_CACHE_SIZE, ttl=config.STARBOARD_MESSAGE_CACHE_TTL)
+
+        # message_id -> StarEntry of recently starred messages
+        self._entries: typing.Dict[int, StarEntry] = dict()
+
+        # (entry_id, starrer_id) -> True if the star still has to be inserted, False if it has to be deleted
+        self._pending_starrers: typing.Dict[typing.Tuple[int, int], bool] = dict()
+        self.flush_starrers.start()
+
+        self._backfill_task: typing.Optional[asyncio.Task] = None
+
+        # Only star reactions reach the listeners, everything else is filtered out by the reaction router
+        self.bot.reactions.add_listener(self.star_emoji, self.star_listener, event='add')
+        self.bot.reactions.add_listener(self.star_emoji, self.unstar_listener, event='remove')
+        self.bot.loop.create_task(self.resume_backfill())
+
         if config.STARBOARD_ENABLED and config.STARBOARD_REDDIT_SUMMARY_ENABLED:
             if not config.REDDIT_SUBREDDIT:
                 print("[BOT] ERROR - Starboard Reddit post is enabled but no subreddit was provided in config.py!")
@@ -60,7 +151,63 @@ class Starboard(commands.Cog):
                 self.weekly_starboard_to_reddit_task.start()
 
     def cog_unload(self):
+        self.bot.reactions.remove_listener(self.star_emoji, self.star_listener, event='add')
+        self.bot.reactions.remove_listener(self.star_emoji, self.unstar_listener, event='remove')
         self.weekly_starboard_to_reddit_task.cancel()
+        self.flush_starrers.cancel()
+        self.bot.loop.create_task(self.flush_pending_starrers())
+
+        if self._backfill_task is not None:
+            self._backfill_task.cancel()
+
+    async def flush_pending_starrers(self):
+        """Writes all stars and unstars since the last flush to the database with one statement each"""
+
+        if not self._pending_starrers:
+            return
+
+        pending, self._pending_starrers = self._pending_starrers, dict()
+        to_insert = [key for key, add in pending.items() if add]
+        to_delete = [key for key, add in pending.items() if not add]
+
+        try:
+            if to_insert:
+                # The join skips stars of entries that were deleted in the meantime
+                await self.bot.db.execute("""INSERT INTO starboard_starrers (entry_id, starrer_id)
+                                             SELECT x.entry_id, x.starrer_id
+                                             FROM unnest($1::int[], $2::bigint[]) AS x(entry_id, starrer_id)
+                                             JOIN starboard_entries entry ON entry.id = x.entry_id
+                                             ON CONFLICT DO NOTHING""",
+                                          [entry_id for entry_id, _ in to_insert],
+                                          [starrer_id for _, starrer_id in to_insert])
+
+            if to_delete:
+                await self.bot.db.execute("""DELETE FROM starboard_starrers
+                                             USING unnest($1::int[], $2::bigint[]) AS x(entry_id, starrer_id)
+                                             WHERE starboard_starrers.entry_id = x.entry_id
+                                             AND starboard_starrers.starrer_id = x.starrer_id""",
+                                          [entry_id for entry_id, _ in to_delete],
+                                          [starrer_id for _, starrer_id in to_delete])
+        except Exception:
+            # Try again with the next flush, newer changes to the same star take precedence
+            pending.update(self._pending_starrers)
+            self._pending_starrers = pending
+            raise
+
+    @tasks.loop(seconds=10)
+    async def flush_starrers(self):
+        await self.flush_pending_starrers()
+
+        # Messages that are too old can't be starred anymore, so there's no need to keep them in memory
+        max_age = datetime.datetime.utcnow() - datetime.timedelta(days=config.STARBOARD_MAX_AGE)
+
+        for message_id in [m for m, entry in self._entries.items()
+                           if entry.created_at < max_age and not entry.is_updating]:
+            del self._entries[message_id]
+
+    @flush_starrers.before_loop
+    async def before_flush_starrers(self):
+        await self.bot.wait_until_ready()
 
     @staticmethod
     def group_starred_messages_by_day(starred_messages: typing.List[asyncpg.Record]) -> typing.List[
@@ -208,7 +355,7 @@ class Starboard(commands.Cog):
     def starboard_channel(self) -> typing.Optional[discord.TextChannel]:
         return self.bot.democraciv_guild_object.get_channel(config.STARBOARD_CHANNEL)
 
-    def get_starboard_embed(self, message: discord.Message, stars: int) -> discord.Embed:
+    def get_starboard_embed(self, message: MessageSnapshot, stars: int) -> discord.Embed:
         """Returns the embed to be posted to the Starboard channel"""
 
         footer_text = f"{stars} star" if stars == 1 else f"{stars} stars"
@@ -218,23 +365,40 @@ class Starboard(commands.Cog):
         embed.set_footer(text=footer_text, icon_url="https://cdn.discordapp.com/attachments/"
                                                     "639549494693724170/679824104190115911/star.png")
         embed.timestamp = message.created_at
-        embed.set_author(name=message.author.display_name, icon_url=message.author.avatar_url_as(static_format='png'))
+        embed.set_author(name=message.author_name, icon_url=message.author_avatar_url)
         embed.add_field(name="Original", value=f"[Jump]({message.jump_url})", inline=False)
 
-        if message.embeds:
-            data = message.embeds[0]
-            if data.type == 'image':
-                embed.set_image(url=data.url)
+        if message.image_url:
+            embed.set_image(url=message.image_url)
 
-        if message.attachments:
-            file = message.attachments[0]
-            if file.url.lower().endswith(('png', 'jpeg', 'jpg', 'gif', 'webp')):
-                embed.set_image(url=file.url)
-            else:
-                embed.add_field(name='Attachment', value=f'[{file.filename}]({file.url})', inline=False)
+        if message.attachment:
+            filename, url = message.attachment
+            embed.add_field(name='Attachment', value=f'[{filename}]({url})', inline=False)
 
         return embed
 
+    async def get_message_snapshot(self, channel: discord.TextChannel, message_id: int) -> MessageSnapshot:
+        """Returns a snapshot of a message from our own cache, discord.py's message cache or, if it's in neither,
+        from the API"""
+
+        snapshot = self._messages.get(message_id)
+
+        if snapshot is not None:
+            return snapshot
+
+        message = discord.utils.get(self.bot.cached_messages, id=message_id)
+
+        if message is None:
+            message = await channel.fetch_message(message_id)
+
+        snapshot = MessageSnapshot.from_message(message)
+        self._messages.put(message_id, snapshot)
+        return snapshot
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        self._messages.pop(payload.message_id)
+
     async def verify_reaction(self, payload: discord.RawReactionActionEvent, channel: discord.abc.GuildChannel) -> bool:
         """Checks if a reaction in on_raw_reaction_add is valid for the Starboard"""
 
@@ -258,17 +422,16 @@ class Starboard(commands.Cog):
 
         return True
 
-    @commands.Cog.listener(name='on_raw_reaction_add')
     async def star_listener(self, payload: discord.RawReactionActionEvent):
         channel = self.bot.democraciv_guild_object.get_channel(payload.channel_id)
 
         if not await self.verify_reaction(payload, channel):
             return
 
-        message = await channel.fetch_message(payload.message_id)
+        message = await self.get_message_snapshot(channel, payload.message_id)
 
         # Do this check here instead of in verify_reaction() to not waste a possibly useless API call
-        if payload.user_id == message.author.id:
+        if payload.user_id == message.author_id:
             return
 
         max_age = datetime.datetime.utcnow() - datetime.timedelta(days=config.STARBOARD_MAX_AGE)
@@ -276,149 +439,397 @@ class Starboard(commands.Cog):
         if message.created_at < max_age:
             return
 
-        if (not message.content and len(message.attachments) == 0) or message.type is not discord.MessageType.default:
+        if not message.is_starrable:
             return
 
         starrer = self.bot.democraciv_guild_object.get_member(payload.user_id)
 
         await self.star_message(message, starrer)
 
-    @commands.Cog.listener(name='on_raw_reaction_remove')
     async def unstar_listener(self, payload: discord.RawReactionActionEvent):
         channel = self.bot.democraciv_guild_object.get_channel(payload.channel_id)
 
         if not await self.verify_reaction(payload, channel):
             return
 
-        message = await channel.fetch_message(payload.message_id)
+        message = await self.get_message_snapshot(channel, payload.message_id)
 
         # Do this check here instead of in verify_reaction() to not waste a possibly useless API call
-        if payload.user_id == message.author.id:
+        if payload.user_id == message.author_id:
             return
 
         starrer = self.bot.democraciv_guild_object.get_member(payload.user_id)
 
         await self.unstar_message(message, starrer)
 
-    async def star_message(self, message: discord.Message, starrer: discord.Member):
-        """Star a message"""
+    async def get_star_entry(self, message: MessageSnapshot, *, create: bool) -> typing.Optional[StarEntry]:
+        """Returns the in-memory entry of a message, loading it and its starrers from the database with a single
+        query the first time. If create is True, a new starboard_entries row is created if there is none yet."""
 
-        query = """INSERT INTO starboard_entries (author_id, message_id, message_content, channel_id, guild_id,
-                   message_creation_date, message_jump_url, message_image_url) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                   ON CONFLICT DO NOTHING RETURNING id"""
+        entry = self._entries.get(message.id)
 
-        image_url = None
+        if entry is not None:
+            return entry
 
-        if message.embeds:
-            data = message.embeds[0]
-            if data.type == 'image':
-                image_url = data.url
+        if create:
+            query = """WITH entry AS (
+                           INSERT INTO starboard_entries (author_id, message_id, message_content, channel_id, guild_id,
+                           message_creation_date, message_jump_url, message_image_url)
+                           VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                           ON CONFLICT (message_id) DO UPDATE SET message_id = EXCLUDED.message_id
+                           RETURNING id, message_id, starboard_message_id
+                       )
+                       SELECT entry.*, ARRAY(SELECT starrer_id FROM starboard_starrers
+                                             WHERE entry_id = entry.id) AS starrers
+                       FROM entry"""
 
-        if message.attachments:
-            file = message.attachments[0]
-            if file.url.lower().endswith(('png', 'jpeg', 'jpg', 'gif', 'webp')):
-                image_url = file.url
+            record = await self.bot.db.fetchrow(query, message.author_id, message.id, message.clean_content,
+                                                message.channel_id, message.guild_id, message.created_at,
+                                                message.jump_url, message.image_url)
+        else:
+            record = await self.bot.db.fetchrow("""SELECT id, message_id, starboard_message_id,
+                                                   ARRAY(SELECT starrer_id FROM starboard_starrers
+                                                         WHERE entry_id = starboard_entries.id) AS starrers
+                                                   FROM starboard_entries WHERE message_id = $1""", message.id)
 
-        entry_id = await self.bot.db.fetchval(query,
-                                              message.author.id, message.id, message.clean_content,
-                                              message.channel.id, message.guild.id, message.created_at,
-                                              message.jump_url, image_url)
+            if record is None:
+                return None
 
-        if entry_id is None:
-            entry_id = await self.bot.db.fetchval("SELECT id FROM starboard_entries WHERE message_id = $1", message.id)
+        # Another reaction might have loaded the entry while we were waiting for the database
+        return self._entries.setdefault(message.id, StarEntry(record, message.created_at))
 
-        try:
-            await self.bot.db.execute("INSERT INTO starboard_starrers (entry_id, starrer_id) VALUES ($1, $2)",
-                                      entry_id, starrer.id)
-        except asyncpg.UniqueViolationError:
+    def forget_star_entry(self, entry: StarEntry):
+        self._entries.pop(entry.message_id, None)
+
+        for key in [key for key in self._pending_starrers if key[0] == entry.id]:
+            del self._pending_starrers[key]
+
+    async def star_message(self, message: MessageSnapshot, starrer: discord.Member):
+        """Star a message"""
+
+        entry = await self.get_star_entry(message, create=True)
+
+        if starrer.id in entry.starrers:
             return
 
-        amount_of_stars = await self.bot.db.fetchval("SELECT COUNT(*) FROM starboard_starrers WHERE entry_id = $1",
-                                                     entry_id)
+        entry.starrers.add(starrer.id)
+        self._pending_starrers[(entry.id, starrer.id)] = True
+        self.schedule_starboard_update(entry, message)
 
-        if amount_of_stars < self.star_threshold:
+    async def unstar_message(self, message: MessageSnapshot, starrer: discord.Member):
+        """Unstars a message"""
+
+        entry = await self.get_star_entry(message, create=False)
+
+        if entry is None or starrer.id not in entry.starrers:
+            # Starboard message was removed and database entry cleared
             return
 
-        # Send embed to starboard channel or update amount of stars in existing embed
-        bot_message = await self.bot.db.fetchval("SELECT starboard_message_id FROM starboard_entries "
-                                                 "WHERE id = $1", entry_id)
+        entry.starrers.discard(starrer.id)
+        self._pending_starrers[(entry.id, starrer.id)] = False
+        self.schedule_starboard_update(entry, message)
 
-        embed = self.get_starboard_embed(message, amount_of_stars)
+    def schedule_starboard_update(self, entry: StarEntry, message: MessageSnapshot):
+        """Updates the starboard message of an entry once there were no new stars or unstars for
+        STARBOARD_UPDATE_DELAY seconds, so that a burst of reactions results in at most one send, edit or delete"""
 
-        if bot_message is None:
-            # Send new message
-            new_bot_message = await self.starboard_channel.send(embed=embed)
-            await self.bot.db.execute("UPDATE starboard_entries SET starboard_message_id = $1,"
-                                      " starboard_message_created_at = $3 WHERE id = $2",
-                                      new_bot_message.id, entry_id, new_bot_message.created_at)
+        entry.message = message
+        entry.update_at = self.bot.loop.time() + config.STARBOARD_UPDATE_DELAY
 
-        else:
-            # Update star amount
-            try:
-                old_bot_message = await self.starboard_channel.fetch_message(bot_message)
-            except discord.NotFound:
-                await self.bot.db.execute("DELETE FROM starboard_entries WHERE id = $1", entry_id)
-            else:
-                await old_bot_message.edit(embed=embed)
+        if not entry.is_updating:
+            entry.update_task = self.bot.loop.create_task(self.debounce_starboard_update(entry))
 
-    async def unstar_message(self, message: discord.Message, starrer: discord.Member):
-        """Unstars a message"""
+    async def debounce_starboard_update(self, entry: StarEntry):
+        while True:
+            delay = entry.update_at - self.bot.loop.time()
 
-        query = """DELETE FROM starboard_starrers USING starboard_entries starboard_entry
-                   WHERE starboard_entry.message_id = $1 AND starboard_entry.id = starboard_starrers.entry_id 
-                   AND starboard_starrers.starrer_id = $2 RETURNING starboard_starrers.entry_id,
-                    starboard_entry.starboard_message_id"""
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
 
-        entry = await self.bot.db.fetchrow(query, message.id, starrer.id)
+            update_at = entry.update_at
 
-        if entry is None:
-            # Starboard message was removed and database entry cleared
+            try:
+                await self.update_starboard_message(entry)
+            except Exception as e:
+                # Nothing awaits this task, so log it here. The next star on this message tries again.
+                print(f"[BOT] Error while updating the starboard message of {entry.message_id}: "
+                      f"{e.__class__.__name__}: {e}")
+                return
+
+            # Stop unless there were new reactions while we were talking to Discord
+            if entry.update_at == update_at:
+                return
+
+    async def update_starboard_message(self, entry: StarEntry):
+        """Sends, edits or deletes the starboard message of an entry according to its current amount of stars"""
+
+        if self._entries.get(entry.message_id) is not entry:
+            # Starboard message was removed and database entry cleared in the meantime
             return
 
-        entry_id = entry[0]
-        bot_message = entry[1]
+        amount_of_stars = entry.stars
 
-        if bot_message is None:
+        if amount_of_stars == entry.posted_stars:
             return
 
-        amount_of_stars = await self.bot.db.fetchval("SELECT COUNT(*) FROM starboard_starrers WHERE entry_id = $1",
-                                                     entry_id)
+        if entry.starboard_message_id is None:
+            if amount_of_stars >= self.star_threshold:
+                # Send new message
+                embed = self.get_starboard_embed(entry.message, amount_of_stars)
+                new_bot_message = await self.starboard_channel.send(embed=embed)
+                entry.starboard_message_id = new_bot_message.id
+                await self.bot.db.execute("UPDATE starboard_entries SET starboard_message_id = $1,"
+                                          " starboard_message_created_at = $3 WHERE id = $2",
+                                          new_bot_message.id, entry.id, new_bot_message.created_at)
+
+            entry.posted_stars = amount_of_stars
+            return
 
         try:
-            old_bot_message = await self.starboard_channel.fetch_message(bot_message)
+            old_bot_message = await self.starboard_channel.fetch_message(entry.starboard_message_id)
         except discord.NotFound:
-            await self.bot.db.execute("DELETE FROM starboard_entries WHERE id = $1", entry_id)
+            self.forget_star_entry(entry)
+            await self.bot.db.execute("DELETE FROM starboard_entries WHERE id = $1", entry.id)
             return
 
         if amount_of_stars < self.star_threshold:
             # Delete starboard message if too few stars
             await old_bot_message.delete()
+            entry.starboard_message_id = None
             await self.bot.db.execute("UPDATE starboard_entries SET starboard_message_id = NULL,"
                                       " starboard_message_created_at = NULL WHERE id = $1",
-                                      entry_id)
+                                      entry.id)
 
         else:
             # Update star amount
-            embed = self.get_starboard_embed(message, amount_of_stars)
+            embed = self.get_starboard_embed(entry.message, amount_of_stars)
             await old_bot_message.edit(embed=embed)
 
+        entry.posted_stars = amount_of_stars
+
     @commands.Cog.listener()
     async def on_raw_message_delete(self, payload):
+        self._messages.pop(payload.message_id)
+
         if self.starboard_channel and self.starboard_channel.id != payload.channel_id:
             return
 
+        for entry in [e for e in self._entries.values() if e.starboard_message_id == payload.message_id]:
+            self.forget_star_entry(entry)
+
         await self.bot.db.execute("DELETE FROM starboard_entries WHERE starboard_message_id = $1", payload.message_id)
 
     @commands.Cog.listener()
     async def on_raw_bulk_message_delete(self, payload):
+        for message_id in payload.message_ids:
+            self._messages.pop(message_id)
+
         if self.starboard_channel and self.starboard_channel.id != payload.channel_id:
             return
 
         messages = list(payload.message_ids)
 
+        for entry in [e for e in self._entries.values() if e.starboard_message_id in payload.message_ids]:
+            self.forget_star_entry(entry)
+
         await self.bot.db.execute("DELETE FROM starboard_entries WHERE starboard_message_id = ANY($1::bigint[]);",
                                   messages)
 
+    async def get_starrers(self, message: discord.Message, semaphore: asyncio.Semaphore) -> typing.List[int]:
+        """Returns the ids of everyone that reacted with a star to message, except for its author"""
+
+        reaction = discord.utils.find(lambda r: str(r.emoji) == self.star_emoji, message.reactions)
+
+        if reaction is None:
+            return []
+
+        async with semaphore:
+            users = await reaction.users().flatten()
+
+        return [user.id for user in users if user.id != message.author.id]
+
+    async def backfill_messages(self, channel: discord.TextChannel, messages: typing.List[discord.Message],
+                                semaphore: asyncio.Semaphore):
+        """Replaces the stored stars of messages with their actual star reactions and records the last message as the
+        channel's progress, all in one transaction"""
+
+        snapshots = [MessageSnapshot.from_message(message) for message in messages]
+        starrable = [(snapshot, message) for snapshot, message in zip(snapshots, messages) if snapshot.is_starrable]
+        starrers = await asyncio.gather(*(self.get_starrers(message, semaphore) for _, message in starrable))
+
+        entries = []
+        stars = []
+
+        for (snapshot, _), starrer_ids in zip(starrable, starrers):
+            self._messages.put(snapshot.id, snapshot)
+
+            if not starrer_ids:
+                continue
+
+            entries.append((snapshot.author_id, snapshot.id, snapshot.clean_content, snapshot.channel_id,
+                            snapshot.guild_id, snapshot.created_at, snapshot.jump_url, snapshot.image_url))
+            stars.extend((snapshot.id, starrer_id) for starrer_id in starrer_ids)
+
+        # Write live stars first, they'd otherwise be deleted below as they're not in the scanned reactions yet
+        await self.flush_pending_starrers()
+
+        async with self.bot.db.acquire() as con:
+            async with con.transaction():
+                await con.execute("""CREATE TEMPORARY TABLE backfill_entries (author_id bigint, message_id bigint,
+                                     message_content text, channel_id bigint, guild_id bigint,
+                                     message_creation_date timestamp, message_jump_url text,
+                                     message_image_url text) ON COMMIT DROP;
+                                     CREATE TEMPORARY TABLE backfill_starrers (message_id bigint, starrer_id bigint)
+                                     ON COMMIT DROP;
+                                     CREATE TEMPORARY TABLE backfill_scanned (message_id bigint) ON COMMIT DROP;""")
+
+                await con.copy_records_to_table('backfill_entries', records=entries)
+                await con.copy_records_to_table('backfill_starrers', records=stars)
+                await con.copy_records_to_table('backfill_scanned',
+                                                records=[(snapshot.id,) for snapshot, _ in starrable])
+
+                await con.execute("""INSERT INTO starboard_entries (author_id, message_id, message_content,
+                                     channel_id, guild_id, message_creation_date, message_jump_url, message_image_url)
+                                     SELECT * FROM backfill_entries
+                                     ON CONFLICT (message_id) DO NOTHING;
+
+                                     DELETE FROM starboard_starrers
+                                     USING starboard_entries entry, backfill_scanned scanned
+                                     WHERE starboard_starrers.entry_id = entry.id
+                                     AND entry.message_id = scanned.message_id
+                                     AND NOT EXISTS (SELECT 1 FROM backfill_starrers star
+                                                     WHERE star.message_id = entry.message_id
+                                                     AND star.starrer_id = starboard_starrers.starrer_id);
+
+                                     INSERT INTO starboard_starrers (entry_id, starrer_id)
+                                     SELECT entry.id, star.starrer_id FROM backfill_starrers star
+                                     INNER JOIN starboard_entries entry ON entry.message_id = star.message_id
+                                     ON CONFLICT DO NOTHING;""")
+
+                await con.execute("""INSERT INTO starboard_backfill_progress (channel_id, last_message_id,
+                                     scanned_messages) VALUES ($1, $2, $3)
+                                     ON CONFLICT (channel_id) DO UPDATE
+                                     SET last_message_id = EXCLUDED.last_message_id,
+                                     scanned_messages = starboard_backfill_progress.scanned_messages +
+                                                        EXCLUDED.scanned_messages""",
+                                  channel.id, messages[-1].id, len(messages))
+
+        # Reload these from the database the next time they're starred. Entries with a pending debounced update are
+        # kept, dropping them would discard that update, and fix_starboard_messages() corrects them afterwards
+        for snapshot, _ in starrable:
+            entry = self._entries.get(snapshot.id)
+
+            if entry is not None and not entry.is_updating:
+                del self._entries[snapshot.id]
+
+    async def fix_starboard_messages(self, since: datetime.datetime):
+        """Sends, edits or deletes the starboard message of every recent entry according to its stars"""
+
+        records = await self.bot.db.fetch("""SELECT message_id, channel_id FROM starboard_entries
+                                             WHERE message_creation_date > $1
+                                             AND (stars >= $2 OR starboard_message_id IS NOT NULL)""",
+                                          since, self.star_threshold)
+
+        for record in records:
+            channel = self.bot.democraciv_guild_object.get_channel(record['channel_id'])
+
+            if channel is None:
+                continue
+
+            try:
+                snapshot = await self.get_message_snapshot(channel, record['message_id'])
+            except discord.HTTPException:
+                continue
+
+            entry = await self.get_star_entry(snapshot, create=False)
+
+            if entry is None:
+                continue
+
+            entry.message = snapshot
+            entry.posted_stars = None
+            await self.update_starboard_message(entry)
+
+    async def run_backfill(self, status: discord.Message = None):
+        """Rebuilds the stars of every message younger than STARBOARD_MAX_AGE from its star reactions, resuming where
+        a previous, interrupted run left off in starboard_backfill_progress"""
+
+        guild = self.bot.democraciv_guild_object
+        since = datetime.datetime.utcnow() - datetime.timedelta(days=config.STARBOARD_MAX_AGE)
+        semaphore = asyncio.Semaphore(config.STARBOARD_BACKFILL_CONCURRENCY)
+
+        progress = {r['channel_id']: r for r in await self.bot.db.fetch("SELECT * FROM starboard_backfill_progress")}
+        channels = []
+
+        for channel in guild.text_channels:
+            if channel.id == config.STARBOARD_CHANNEL or not channel.permissions_for(guild.me).read_message_history:
+                continue
+
+            if await self.bot.checks.is_channel_excluded(guild.id, channel.id):
+                continue
+
+            channels.append(channel)
+
+        async def report(text: str):
+            print(f"[BOT] Starboard backfill: {text}")
+
+            if status is not None:
+                await status.edit(content=f":arrows_counterclockwise: {text}")
+
+        for done, channel in enumerate(channels, start=1):
+            record = progress.get(channel.id)
+
+            if record is not None and record['is_finished']:
+                continue
+
+            after = since
+
+            if record is not None and record['last_message_id']:
+                last_message = discord.Object(id=record['last_message_id'])
+
+                if last_message.created_at > since:
+                    after = last_message
+
+            batch = []
+
+            async for message in channel.history(limit=None, after=after):
+                batch.append(message)
+
+                if len(batch) == 100:
+                    await self.backfill_messages(channel, batch, semaphore)
+                    batch = []
+
+            if batch:
+                await self.backfill_messages(channel, batch, semaphore)
+
+            scanned = await self.bot.db.fetchval("""INSERT INTO starboard_backfill_progress (channel_id, is_finished)
+                                                    VALUES ($1, true)
+                                                    ON CONFLICT (channel_id) DO UPDATE SET is_finished = true
+                                                    RETURNING scanned_messages""", channel.id)
+
+            await report(f"Scanned {scanned} messages in #{channel.name} ({done}/{len(channels)} channels).")
+
+        await report("Fixing starboard messages...")
+        await self.fix_starboard_messages(since)
+        await self.bot.db.execute("DELETE FROM starboard_backfill_progress")
+
+        print("[BOT] Starboard backfill finished.")
+
+        if status is not None:
+            await status.edit(content=f":white_check_mark: Rebuilt the stars of {len(channels)} channels and fixed "
+                                      f"the starboard.")
+
+    async def resume_backfill(self):
+        await self.bot.wait_until_ready()
+
+        if self.bot.db is None or self.bot.democraciv_guild_object is None:
+            await asyncio.sleep(5)
+
+        if await self.bot.db.fetchval("SELECT EXISTS (SELECT 1 FROM starboard_backfill_progress)"):
+            print("[BOT] Resuming interrupted starboard backfill...")
+            self._backfill_task = self.bot.loop.create_task(self.run_backfill())
+
     @commands.group(name='star', aliases=['starboard', 'stars'], case_insensitive=True,
                     invoke_without_command=True, hidden=True)
     @commands.cooldown(1, config.BOT_COMMAND_COOLDOWN, commands.BucketType.user)
@@ -442,28 +853,13 @@ class Starboard(commands.Cog):
         embed = self.bot.embeds.embed_builder(title='', description='', colour=0xFFAC33, has_footer=False)
         embed.set_author(name=member.display_name, icon_url=member.avatar_url_as(static_format='png'))
 
-        stars_received = await self.bot.db.fetchval("""SELECT COUNT(*)
-                                                    FROM starboard_starrers
-                                                    INNER JOIN starboard_entries entry
-                                                    ON entry.id=starboard_starrers.entry_id
-                                                    WHERE entry.author_id=$1;""",
-                                                    member.id)
+        stats = await self.bot.db.fetchrow("SELECT stars_received, stars_given, messages_starred "
+                                           "FROM starboard_stats WHERE user_id = $1", member.id)
 
-        stars_given = await self.bot.db.fetchval("""SELECT COUNT(*)
-                                                    FROM starboard_starrers
-                                                    INNER JOIN starboard_entries entry
-                                                    ON entry.id=starboard_starrers.entry_id
-                                                    WHERE starboard_starrers.starrer_id=$1;""",
-                                                 member.id)
-
-        top_three_starred = await self.bot.db.fetch("""SELECT entry.message_jump_url, COUNT(*) AS "stars"
-                                                            FROM starboard_starrers
-                                                            INNER JOIN starboard_entries entry
-                                                            ON entry.id=starboard_starrers.entry_id
-                                                            WHERE entry.author_id=$1
-                                                            GROUP BY entry.message_jump_url
-                                                            ORDER BY "stars" DESC
-                                                            LIMIT 3;""",
+        top_three_starred = await self.bot.db.fetch("""SELECT message_jump_url, stars FROM starboard_entries
+                                                       WHERE author_id = $1 AND stars > 0
+                                                       ORDER BY stars DESC
+                                                       LIMIT 3;""",
                                                     member.id)
 
         top_three_starred_fmt = []
@@ -472,8 +868,9 @@ class Starboard(commands.Cog):
             top_three_starred_fmt.append({"ID": f"[Jump to Message]({record['message_jump_url']})",
                                           "Stars": record['stars']})
 
-        query = """SELECT COUNT(*) FROM starboard_entries WHERE starboard_message_id IS NOT NULL AND author_id = $1;"""
-        messages_starred = await self.bot.db.fetchval(query, member.id)
+        stars_received = stats['stars_received'] if stats else 0
+        stars_given = stats['stars_given'] if stats else 0
+        messages_starred = stats['messages_starred'] if stats else 0
 
         embed.add_field(name='Messages on the Starboard', value=messages_starred, inline=False)
         embed.add_field(name='Stars Received', value=stars_received, inline=True)
@@ -482,73 +879,39 @@ class Starboard(commands.Cog):
         await ctx.send(embed=embed)
 
     async def star_overall_stats(self, ctx):
-        total_starred_messages = await self.bot.db.fetchval("SELECT COUNT(*) FROM starboard_entries")
-        total_stars = await self.bot.db.fetchval("SELECT COUNT(*) FROM starboard_starrers INNER JOIN starboard_entries "
-                                                 "entry ON entry.id = starboard_starrers.entry_id;")
+        totals = await self.bot.db.fetchrow("SELECT COUNT(*) AS messages, COALESCE(SUM(stars), 0) AS stars "
+                                            "FROM starboard_entries")
 
         embed = self.bot.embeds.embed_builder(title='Starboard Stats',
-                                              description=f'So far, there are {total_starred_messages} messages starred'
-                                                          f' with a total of {total_stars} stars.',
+                                              description=f'So far, there are {totals["messages"]} messages starred'
+                                                          f' with a total of {totals["stars"]} stars.',
                                               colour=0xFFAC33,
                                               has_footer=False)
 
-        # this big query fetches 3 things:
-        # top 3 starred posts (Type 3)
-        # top 3 most starred authors  (Type 1)
-        # top 3 star givers (Type 2)
-        query = """WITH t AS (
-                           SELECT
-                               entry.author_id AS entry_author_id,
-                               starboard_starrers.starrer_id,
-                               entry.starboard_message_id
-                           FROM starboard_starrers
-                           INNER JOIN starboard_entries entry
-                           ON entry.id = starboard_starrers.entry_id
-                       )
-                       (
-                           SELECT t.entry_author_id AS "ID", 1 AS "Type", COUNT(*) AS "Stars"
-                           FROM t
-                           WHERE t.entry_author_id IS NOT NULL
-                           GROUP BY t.entry_author_id
-                           ORDER BY "Stars" DESC
-                           LIMIT 3
-                       )
-                       UNION ALL
-                       (
-                           SELECT t.starrer_id AS "ID", 2 AS "Type", COUNT(*) AS "Stars"
-                           FROM t
-                           GROUP BY t.starrer_id
-                           ORDER BY "Stars" DESC
-                           LIMIT 3
-                       )
-                       UNION ALL
-                       (
-                           SELECT t.starboard_message_id AS "ID", 3 AS "Type", COUNT(*) AS "Stars"
-                           FROM t
-                           WHERE t.starboard_message_id IS NOT NULL
-                           GROUP BY t.starboard_message_id
-                           ORDER BY "Stars" DESC
-                           LIMIT 3
-                       );"""
-
-        records = await self.bot.db.fetch(query)
-        starred_posts = [r for r in records if r['Type'] == 3]
-        starred_posts_with_link = []
-
-        for post in starred_posts:
-            record = await self.bot.db.fetchval("SELECT message_jump_url FROM starboard_entries "
-                                                "WHERE starboard_message_id = $1", post['ID'])
-            starred_posts_with_link.append({"ID": f"[Jump to Message]({record})", "Stars": post['Stars']})
+        # All three top 3s are read from the counters that the starboard_*_stats_trigger triggers maintain
+        starred_posts = await self.bot.db.fetch("""SELECT message_jump_url, stars FROM starboard_entries
+                                                   WHERE starboard_message_id IS NOT NULL
+                                                   ORDER BY stars DESC
+                                                   LIMIT 3;""")
+
+        starred_posts_with_link = [{"ID": f"[Jump to Message]({r['message_jump_url']})", "Stars": r['stars']}
+                                   for r in starred_posts]
 
         embed.add_field(name='Top Starred Messages', value=self.records_to_value(starred_posts_with_link), inline=False)
 
         to_mention = lambda o: f'<@{o}>'
 
-        star_receivers = [r for r in records if r['Type'] == 1]
+        star_receivers = await self.bot.db.fetch("""SELECT user_id AS "ID", stars_received AS "Stars"
+                                                    FROM starboard_stats WHERE stars_received > 0
+                                                    ORDER BY stars_received DESC
+                                                    LIMIT 3;""")
         value = self.records_to_value(star_receivers, to_mention, default='No one!')
         embed.add_field(name='Top Star Receivers', value=value, inline=False)
 
-        star_givers = [r for r in records if r['Type'] == 2]
+        star_givers = await self.bot.db.fetch("""SELECT user_id AS "ID", stars_given AS "Stars"
+                                                 FROM starboard_stats WHERE stars_given > 0
+                                                 ORDER BY stars_given DESC
+                                                 LIMIT 3;""")
         value = self.records_to_value(star_givers, to_mention, default='No one!')
         embed.add_field(name='Top Star Givers', value=value, inline=False)
 
@@ -572,6 +935,17 @@ class Starboard(commands.Cog):
         else:
             await self.star_member_stats(ctx, member)
 
+    @starboard.command(name='backfill', hidden=True)
+    @commands.is_owner()
+    async def backfill(self, ctx):
+        """Rebuild the stars of recent messages from their reactions and fix the Starboard"""
+
+        if self._backfill_task is not None and not self._backfill_task.done():
+            return await ctx.send(":x: The backfill is already running.")
+
+        status = await ctx.send(":arrows_counterclockwise: Starting backfill...")
+        self._backfill_task = self.bot.loop.create_task(self.run_backfill(status))
+
 
 def setup(bot):
     if config.STARBOARD_ENABLED:
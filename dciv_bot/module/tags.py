@@ -1,5 +1,3 @@
-import re
-import enum
 import typing
 import discord
 
@@ -11,16 +9,7 @@ from dciv_bot.util.flow import Flow
 from discord.ext import commands
 from dciv_bot.util.paginator import AlternativePages
 from dciv_bot.util.converter import Tag, OwnedTag, CaseInsensitiveMember
-
-
-class TagContentType(enum.Enum):
-    TEXT = 1
-    IMAGE = 2
-    INVITE = 3
-    CUSTOM_EMOJI = 4
-    YOUTUBE_TENOR_GIPHY = 5
-    VIDEO = 6
-    PARTIAL_IMAGE = 7
+from dciv_bot.util.tag_content import TagContentType, get_tag_content_type
 
 
 class Tags(commands.Cog):
@@ -35,10 +24,10 @@ class Tags(commands.Cog):
     async def tags(self, ctx):
         """List all tags on this server"""
 
-        global_tags = await self.bot.db.fetch("SELECT * FROM guild_tags WHERE global = true ORDER BY uses desc")
-        all_tags = await self.bot.db.fetch("SELECT * FROM guild_tags WHERE guild_id = $1 AND global = false"
-                                           " ORDER BY uses desc",
-                                           ctx.guild.id)
+        await self.bot.tag_cache.wait_until_ready()
+
+        global_tags = self.bot.tag_cache.get_tags(lambda tag: tag['global'])
+        all_tags = self.bot.tag_cache.get_tags(lambda tag: tag['guild_id'] == ctx.guild.id and not tag['global'])
 
         pretty_tags = []
 
@@ -72,8 +61,8 @@ class Tags(commands.Cog):
     async def local(self, ctx):
         """List all non-global tags on this server"""
 
-        all_tags = await self.bot.db.fetch("SELECT * FROM guild_tags WHERE guild_id = $1 AND global = false "
-                                           "ORDER BY uses desc", ctx.guild.id)
+        await self.bot.tag_cache.wait_until_ready()
+        all_tags = self.bot.tag_cache.get_tags(lambda tag: tag['guild_id'] == ctx.guild.id and not tag['global'])
 
         if not all_tags:
             embed = self.bot.embeds.embed_builder(title="There are no local tags on this server.",
@@ -100,9 +89,9 @@ class Tags(commands.Cog):
 
         member = member or ctx.author
 
-        all_tags = await self.bot.db.fetch("SELECT * FROM guild_tags WHERE author = $1 AND guild_id = $2"
-                                           " ORDER BY uses desc",
-                                           member.id, ctx.guild.id)
+        await self.bot.tag_cache.wait_until_ready()
+        all_tags = self.bot.tag_cache.get_tags(lambda tag: tag['author'] == member.id and
+                                                           tag['guild_id'] == ctx.guild.id)
 
         if not all_tags:
             embed = self.bot.embeds.embed_builder(title=f"{member} hasn't made any tags on this server yet.",
@@ -159,6 +148,7 @@ class Tags(commands.Cog):
                                                ctx.guild.id, tag.is_global)
 
         if status == "INSERT 0 1":
+            await self.bot.tag_cache.refresh(tag.id)
             await ctx.send(f':white_check_mark: The `{config.BOT_PREFIX}{alias}` alias was added to '
                            f'`{config.BOT_PREFIX}{tag.name}`.')
 
@@ -192,9 +182,11 @@ class Tags(commands.Cog):
                 async with con.transaction():
                     await con.execute("DELETE FROM guild_tags_alias WHERE alias = $1 AND tag_id = $2",
                                       alias.invoked_with, alias.id)
-                    await ctx.send(f":white_check_mark: Successfully removed the alias "
-                                   f"`{config.BOT_PREFIX}{alias.invoked_with}` from "
-                                   f"`{config.BOT_PREFIX}{alias.name}`.")
+
+            await self.bot.tag_cache.refresh(alias.id)
+            await ctx.send(f":white_check_mark: Successfully removed the alias "
+                           f"`{config.BOT_PREFIX}{alias.invoked_with}` from "
+                           f"`{config.BOT_PREFIX}{alias.name}`.")
 
     async def validate_tag_name(self, ctx, tag_name: str) -> bool:
         tag_name = tag_name.lower()
@@ -215,17 +207,13 @@ class Tags(commands.Cog):
             await ctx.send(":x: You can't create a tag with the same name of one of my commands!")
             return False
 
-        global_tags = await self.bot.db.fetch("SELECT * FROM guild_tags_alias WHERE global = true AND alias = $1",
-                                              tag_name)
+        await self.bot.tag_cache.wait_until_ready()
 
-        if len(global_tags) > 0:
+        if self.bot.tag_cache.is_global_alias(tag_name):
             await ctx.send(":x: A global tag with that name already exists!")
             return False
 
-        found_alias = await self.bot.db.fetch("SELECT * FROM guild_tags_alias WHERE guild_id = $1 AND alias = $2",
-                                              ctx.guild.id, tag_name)
-
-        if len(found_alias) > 0:
+        if self.bot.tag_cache.is_guild_alias(tag_name, ctx.guild.id):
             await ctx.send(":x: A tag or alias with that name already exists on this server.")
             return False
 
@@ -316,14 +304,16 @@ class Tags(commands.Cog):
             async with self.bot.db.acquire() as con:
                 async with con.transaction():
                     _id = await con.fetchval("INSERT INTO guild_tags (guild_id, name, content, title,"
-                                             " global, author, is_embedded) VALUES "
-                                             "($1, $2, $3, $4, $5, $6, $7) RETURNING id",
+                                             " global, author, is_embedded, content_type) VALUES "
+                                             "($1, $2, $3, $4, $5, $6, $7, $8) RETURNING id",
                                              ctx.guild.id, name.lower(), content, title, is_global,
-                                             ctx.author.id, is_embedded)
+                                             ctx.author.id, is_embedded, get_tag_content_type(content).value)
                     await con.execute("INSERT INTO guild_tags_alias (tag_id, alias, guild_id, global)"
                                       " VALUES ($1, $2, $3, $4)", _id, name.lower(),
                                       ctx.guild.id, is_global)
-                    await ctx.send(f":white_check_mark: The `{config.BOT_PREFIX}{name}` tag was added.")
+
+            await self.bot.tag_cache.refresh(_id)
+            await ctx.send(f":white_check_mark: The `{config.BOT_PREFIX}{name}` tag was added.")
 
     @tags.command(name="info", aliases=['about', 'i'])
     @commands.cooldown(1, config.BOT_COMMAND_COOLDOWN, commands.BucketType.user)
@@ -356,7 +346,7 @@ class Tags(commands.Cog):
 
         embed.add_field(name="Global Tag", value=is_global, inline=True)
         embed.add_field(name="Embedded Tag", value=is_embedded, inline=True)
-        embed.add_field(name="Uses", value=str(tag.uses), inline=False)
+        embed.add_field(name="Uses", value=str(self.bot.tag_cache.get_uses(tag.id, tag.uses)), inline=False)
         embed.add_field(name="Aliases", value=pretty_aliases, inline=False)
         await ctx.send(embed=embed)
 
@@ -376,6 +366,7 @@ class Tags(commands.Cog):
             return await ctx.send(":x: The owner of this tag is still in this server.")
 
         await self.bot.db.execute("UPDATE guild_tags SET author = $1 WHERE id = $2", ctx.author.id, tag.id)
+        await self.bot.tag_cache.refresh(tag.id)
 
         return await ctx.send(f":white_check_mark: You are now the owner `{config.BOT_PREFIX}{tag.name}`.")
 
@@ -390,6 +381,7 @@ class Tags(commands.Cog):
             return await ctx.send(":x: You cannot transfer your tag to yourself.")
 
         await self.bot.db.execute("UPDATE guild_tags SET author = $1 WHERE id = $2", to_person.id, tag.id)
+        await self.bot.tag_cache.refresh(tag.id)
 
         return await ctx.send(f":white_check_mark: {to_person} is now the owner of `{config.BOT_PREFIX}{tag.name}`.")
 
@@ -454,8 +446,11 @@ class Tags(commands.Cog):
             return await ctx.send("Aborted.")
 
         else:
-            await self.bot.db.execute("UPDATE guild_tags SET content = $1, title = $3, is_embedded = $4 WHERE id = $2",
-                                      new_content, tag.id, new_title, is_embedded)
+            await self.bot.db.execute("UPDATE guild_tags SET content = $1, title = $3, is_embedded = $4, "
+                                      "content_type = $5 WHERE id = $2",
+                                      new_content, tag.id, new_title, is_embedded,
+                                      get_tag_content_type(new_content).value)
+            await self.bot.tag_cache.refresh(tag.id)
             await ctx.send(":white_check_mark: Your tag was edited.")
 
     @tags.command(name="search", aliases=['s'])
@@ -464,27 +459,27 @@ class Tags(commands.Cog):
     async def search(self, ctx, *, query: str):
         """Search for a global or local tag on this server"""
 
-        db_query = """SELECT tag_id FROM guild_tags_alias
-                      WHERE (global = true AND alias LIKE '%' || $1 || '%') OR 
-                            (alias LIKE '%' || $1 || '%' AND guild_id = $2)
-                      ORDER BY similarity(alias, $1) DESC
+        # Every tag once with its best matching alias, ranked by that alias' similarity and then by the tag's uses.
+        # The alias LIKE '%' || $1 || '%' match uses guild_tags_alias_alias_trgm_idx
+        db_query = """SELECT tag.name, tag.title
+                      FROM (
+                          SELECT DISTINCT ON (alias.tag_id) alias.tag_id, similarity(alias.alias, $1) AS score
+                          FROM guild_tags_alias alias
+                          WHERE alias.alias LIKE '%' || $1 || '%' AND (alias.global = true OR alias.guild_id = $2)
+                          ORDER BY alias.tag_id, score DESC
+                      ) AS match
+                      INNER JOIN guild_tags tag ON tag.id = match.tag_id
+                      ORDER BY match.score DESC, tag.uses DESC
                       LIMIT 20
                     """
 
         tags = await self.bot.db.fetch(db_query, query.lower(), ctx.guild.id)
-        pretty_names = dict()  # Abuse dict as ordered set since you can't use DISTINCT in above SQL query
+        pretty_names = [f"`{config.BOT_PREFIX}{record['name']}`  {record['title']}" for record in tags]
 
-        if not tags:
-            pretty_names['Nothing found.'] = None
-
-        else:
-            for record in tags:
-                details = await self.bot.db.fetchrow("SELECT name, title from guild_tags WHERE id = $1",
-                                                     record['tag_id'])
-                if details:
-                    pretty_names[f"`{config.BOT_PREFIX}{details['name']}`  {details['title']}"] = None
+        if not pretty_names:
+            pretty_names = ['Nothing found.']
 
-        pages = AlternativePages(ctx=ctx, entries=list(pretty_names), show_entry_count=False,
+        pages = AlternativePages(ctx=ctx, entries=pretty_names, show_entry_count=False,
                                  a_title=f"Tags matching '{query}'",
                                  a_icon=ctx.guild.icon_url_as(static_format='png'),
                                  show_index=False, show_amount_of_pages=True)
@@ -502,12 +497,14 @@ class Tags(commands.Cog):
             # Local -> Global
             await self.bot.db.execute("UPDATE guild_tags SET global = true WHERE id = $1", tag.id)
             await self.bot.db.execute("UPDATE guild_tags_alias SET global = true WHERE tag_id = $1", tag.id)
+            await self.bot.tag_cache.refresh(tag.id)
             await ctx.send(f":white_check_mark: `{config.BOT_PREFIX}{tag.name}` is now a global tag. ")
 
         else:
             # Global -> Local
             await self.bot.db.execute("UPDATE guild_tags SET global = false WHERE id = $1", tag.id)
             await self.bot.db.execute("UPDATE guild_tags_alias SET global = false WHERE tag_id = $1", tag.id)
+            await self.bot.tag_cache.refresh(tag.id)
             await ctx.send(f":white_check_mark: `{config.BOT_PREFIX}{tag.name}` is now a local tag.")
 
     @tags.command(name="remove", aliases=['delete'])
@@ -536,88 +533,44 @@ class Tags(commands.Cog):
                     await con.execute("DELETE FROM guild_tags_alias WHERE tag_id = $1", tag.id)
                     await con.execute("DELETE FROM guild_tags WHERE name = $1 AND guild_id = $2",
                                       tag.name, ctx.guild.id)
-                    await ctx.send(f":white_check_mark: `{config.BOT_PREFIX}{tag.name}` was removed.")
 
-    @staticmethod
-    def get_tag_content_type(tag_content: str) -> TagContentType:
-        emoji_pattern = re.compile(r"<(?P<animated>a)?:(?P<name>[0-9a-zA-Z_]{2,32}):(?P<id>[0-9]{15,21})>")
-        discord_invite_pattern = re.compile(r"(?:https?://)?discord(?:app\.com/invite|\.gg)/?[a-zA-Z0-9]+/?")
-        url_pattern = re.compile(
-            r"((http|https)\:\/\/)?[a-zA-Z0-9\.\/\?\:@\-_=#]+\.([a-zA-Z]){2,6}([a-zA-Z0-9\.\&\/\?\:@\-_=#])*")
+            self.bot.tag_cache.remove(tag.id)
+            await ctx.send(f":white_check_mark: `{config.BOT_PREFIX}{tag.name}` was removed.")
 
-        url_endings_image = ('.jpeg', '.jpg', '.png', '.gif', '.webp', '.bmp', '.img', '.svg')
-        url_endings_video = ('.avi', '.mp4', '.mp3', '.mov', '.flv', '.wmv')
+    async def resolve_tag_name(self, query: str, guild: typing.Optional[discord.Guild]):
+        """Returns the global or local tag with that name or alias from the tag cache, in DMs only global tags"""
 
-        if url_pattern.fullmatch(tag_content) and (tag_content.lower().endswith(url_endings_image)):
-            return TagContentType.IMAGE
+        await self.bot.tag_cache.wait_until_ready()
 
-        elif url_pattern.match(tag_content) and (tag_content.lower().endswith(url_endings_image)):
-            return TagContentType.PARTIAL_IMAGE
+        tag_details = self.bot.tag_cache.get(query, guild.id if guild else None)
 
-        elif url_pattern.match(tag_content) and (tag_content.lower().endswith(url_endings_video)):
-            return TagContentType.VIDEO
-
-        elif any(s in tag_content for s in ['youtube', 'youtu.be', 'tenor.com', 'gph.is', 'giphy.com']):
-            return TagContentType.YOUTUBE_TENOR_GIPHY
-
-        elif emoji_pattern.fullmatch(tag_content):
-            return TagContentType.CUSTOM_EMOJI
-
-        elif discord_invite_pattern.match(tag_content):
-            return TagContentType.INVITE
-
-        return TagContentType.TEXT
-
-    async def resolve_tag_name(self, query: str, guild: discord.Guild):
-        tag_id = await self.bot.db.fetchval("SELECT tag_id FROM guild_tags_alias WHERE global = true AND alias = $1",
-                                            query.lower())
-
-        if tag_id is None:
-            tag_id = await self.bot.db.fetchval(
-                "SELECT tag_id FROM guild_tags_alias WHERE alias = $1 AND guild_id = $2",
-                query.lower(), guild.id)
-
-        if tag_id is None:
+        if tag_details is None:
             return None
 
-        tag_details = await self.bot.db.fetchrow("SELECT * FROM guild_tags WHERE id = $1", tag_id)
-
-        await self.bot.db.execute("UPDATE guild_tags SET uses = uses + 1 WHERE id = $1", tag_id)
+        self.bot.tag_cache.record_use(tag_details)
         return tag_details
 
-    @commands.Cog.listener(name="on_message")
-    async def guild_tags_listener(self, message):
-        if not message.content.startswith(config.BOT_PREFIX):
-            return
-
-        if message.author.bot:
-            return
-
-        if (await self.bot.get_context(message)).valid:
-            return
-
-        tag_name = message.content[len(config.BOT_PREFIX):]
+    async def send_tag(self, message: discord.Message, tag_name: str) -> bool:
+        """Replies with the tag that tag_name refers to. Called by DemocracivBot.on_message for prefixed messages that
+        aren't a command.
 
-        if message.guild is None:
-            tag_id = await self.bot.db.fetchval(
-                "SELECT tag_id FROM guild_tags_alias WHERE global = true AND alias = $1",
-                tag_name.lower())
+        Returns False if there is no such tag."""
 
-            if tag_id is None:
-                return
-
-            tag_details = await self.bot.db.fetchrow("SELECT * FROM guild_tags WHERE id = $1", tag_id)
-
-        else:
-            tag_details = await self.resolve_tag_name(tag_name, message.guild)
+        tag_details = await self.resolve_tag_name(tag_name, message.guild)
 
         if tag_details is None:
-            return
+            return False
 
-        tag_content_type = self.get_tag_content_type(tag_details['content'])
+        await self.reply_with_tag(message, tag_details)
+        return True
 
+    async def reply_with_tag(self, message: discord.Message, tag_details: dict):
         if tag_details['is_embedded']:
-            if tag_content_type is TagContentType.IMAGE:
+            if tag_details['content_type'] is None:
+                # Tag was made before guild_tags.content_type existed and wasn't migrated yet
+                tag_details['content_type'] = get_tag_content_type(tag_details['content']).value
+
+            if tag_details['content_type'] == TagContentType.IMAGE.value:
                 embed = discord.Embed(colour=0x2F3136)
                 embed.set_image(url=tag_details['content'])
 
@@ -0,0 +1,37 @@
+import unittest
+
+from dciv_bot.util.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = LRUCache(maxsize=2)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.get('a')
+        self.cache.put('c', 3)
+        self.assertIn('a', self.cache, 'Recently used entry was evicted')
+        self.assertNotIn('b', self.cache, 'Least recently used entry was not evicted')
+        self.assertEqual(len(self.cache), 2)
+
+    def test_hits_and_misses(self):
+        self.cache.put('a', 1)
+        self.cache.get('a')
+        self.cache.get('b')
+        info = self.cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_pop(self):
+        self.cache.put('a', 1)
+        self.assertEqual(self.cache.pop('a'), 1)
+        self.assertIsNone(self.cache.pop('a'))
+
+    def test_ttl_expiry(self):
+        cache = LRUCache(maxsize=2, ttl=0)
+        cache.put('a', 1)
+        self.assertNotIn('a', cache, 'Expired entry is still in the cache')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.cache_info().misses, 1)
@@ -0,0 +1,47 @@
+import unittest
+
+from dciv_bot.util.chunking import chunk_text, chunk_message, add_embed_fields
+
+
+class MockEmbed:
+    def __init__(self):
+        self.fields = []
+
+    def __len__(self):
+        return sum(len(name) + len(value) for name, value in self.fields)
+
+    def add_field(self, *, name, value, inline):
+        self.fields.append((name, value))
+
+
+class TestChunking(unittest.TestCase):
+
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(chunk_message("a\nb"), ["a\nb"])
+
+    def test_chunks_respect_limit_and_keep_lines(self):
+        lines = [f"Bill #{i} - some bill name" for i in range(500)]
+        chunks = chunk_text(lines, 100)
+
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks), "Chunk exceeds limit")
+        self.assertEqual('\n'.join(chunks).splitlines(), lines, "Lines were changed or lost")
+
+    def test_long_line_is_wrapped(self):
+        chunks = chunk_text("word " * 100, 100)
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks))
+
+    def test_code_block_is_reopened(self):
+        text = "```py\n" + '\n'.join(f"line {i}" for i in range(50)) + "\n```"
+        chunks = chunk_text(text, 100)
+
+        self.assertGreater(len(chunks), 1)
+
+        for chunk in chunks:
+            self.assertTrue(chunk.startswith("```py"), "Code block was not reopened")
+            self.assertTrue(chunk.endswith("```"), "Code block was not closed")
+
+    def test_add_embed_fields(self):
+        embed = MockEmbed()
+        self.assertTrue(add_embed_fields(embed, "Bills", '\n'.join(["x" * 100] * 20)))
+        self.assertEqual(embed.fields[1][0], "Bills (cont.)")
+        self.assertFalse(add_embed_fields(embed, "Motions", "x" * 5000), "Embed limit was ignored")
@@ -0,0 +1,28 @@
+import unittest
+
+from dciv_bot.util.search_index import LawSearchIndex, similarity
+
+
+class TestLawSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = LawSearchIndex()
+        self.index.add(1, "Tax Reform Act", "https://a", "Lowers the income tax", ["income", "taxes"])
+        self.index.add(2, "Education Act", "https://b", "Builds schools", ["schools", "education"])
+
+    def test_similarity(self):
+        self.assertEqual(similarity("word", "word"), 1.0)
+        self.assertEqual(similarity("word", ""), 0.0)
+
+    def test_name_match_first(self):
+        results = self.index.search("education act", ["education"])
+        self.assertEqual([law.id for law in results], [2])
+
+    def test_fuzzy_tag_match(self):
+        results = self.index.search("schol", ["schol"])
+        self.assertEqual([law.id for law in results], [2], "Misspelled tag was not found")
+
+    def test_remove(self):
+        self.index.remove(1)
+        self.assertEqual(self.index.search("income", ["income"]), [])
+        self.assertEqual(len(self.index), 1)
@@ -0,0 +1,25 @@
+import unittest
+
+from dciv_bot.util.tag_content import TagContentType, get_tag_content_type
+
+
+class TestTagContentType(unittest.TestCase):
+
+    def test_image(self):
+        self.assertIs(get_tag_content_type("https://i.imgur.com/abc.png"), TagContentType.IMAGE)
+        self.assertIs(get_tag_content_type("look at https://i.imgur.com/abc.png"), TagContentType.TEXT)
+
+    def test_video(self):
+        self.assertIs(get_tag_content_type("https://example.com/clip.mp4"), TagContentType.VIDEO)
+
+    def test_youtube(self):
+        self.assertIs(get_tag_content_type("https://youtu.be/dQw4w9WgXcQ"), TagContentType.YOUTUBE_TENOR_GIPHY)
+
+    def test_custom_emoji(self):
+        self.assertIs(get_tag_content_type("<:dciv:639549494693724170>"), TagContentType.CUSTOM_EMOJI)
+
+    def test_invite(self):
+        self.assertIs(get_tag_content_type("https://discord.gg/AK7dYMG"), TagContentType.INVITE)
+
+    def test_text(self):
+        self.assertIs(get_tag_content_type("Just some text."), TagContentType.TEXT)
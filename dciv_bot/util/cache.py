@@ -1,4 +1,9 @@
+import time
+import typing
 import asyncio
+import collections
+
+from discord.ext import tasks
 
 
 class Cache:
@@ -69,3 +74,229 @@ class Cache:
             return await self.bot.db.fetchval(f"SELECT {setting} FROM guilds WHERE id = $1", guild_id)
 
         return cached
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    """A bounded mapping that evicts the least recently used entry once it holds more than `maxsize` entries.
+    If `ttl` is given, entries also expire that many seconds after they were put into the cache.
+    Keeps track of how many lookups were hits and misses, similar to functools.lru_cache."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()  # key -> (value, expires_at)
+
+    def _is_expired(self, expires_at) -> bool:
+        return expires_at is not None and expires_at <= time.monotonic()
+
+    def __contains__(self, key):
+        try:
+            _, expires_at = self._data[key]
+        except KeyError:
+            return False
+
+        return not self._is_expired(expires_at)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        try:
+            value, expires_at = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        if self._is_expired(expires_at):
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        try:
+            value, _ = self._data.pop(key)
+        except KeyError:
+            return default
+
+        return value
+
+    def clear(self):
+        self._data.clear()
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class TagCache:
+    """Every tag and alias of every guild in memory, so that invoking a tag doesn't need any database reads.
+
+    Global aliases are looked up before the aliases of a guild, the same way the Tag converter does it. Whenever a tag
+    or its aliases change in the database, refresh() or remove() has to be called with that tag's id.
+
+    The 'uses' of cached tags are live, new uses are only written to the database every minute by flush_uses()."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._ready = asyncio.Event()
+
+        # tag_id -> uses that are not in the database yet
+        self._pending_uses: typing.Counter[int] = collections.Counter()
+        self.flush_uses_task.start()
+
+        self._tags: typing.Dict[int, dict] = dict()
+        self._global_aliases: typing.Dict[str, int] = dict()
+        self._guild_aliases: typing.Dict[typing.Tuple[int, str], int] = dict()
+
+        # tag_id -> its aliases as (guild_id, alias, is_global), to find them again in refresh() and remove()
+        self._aliases_of: typing.Dict[int, typing.Set[typing.Tuple[int, str, bool]]] = collections.defaultdict(set)
+
+    def __len__(self):
+        return len(self._tags)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def wait_until_ready(self):
+        """Waits until build() has loaded all tags, lookups before that would wrongly find nothing"""
+        await self._ready.wait()
+
+    async def build(self):
+        tags = await self.bot.db.fetch("SELECT * FROM guild_tags")
+        aliases = await self.bot.db.fetch("SELECT tag_id, guild_id, alias, global FROM guild_tags_alias")
+
+        self._tags.clear()
+        self._global_aliases.clear()
+        self._guild_aliases.clear()
+        self._aliases_of.clear()
+
+        for record in tags:
+            self._add_tag(record)
+
+        for record in aliases:
+            self._add_alias(record['tag_id'], record['guild_id'], record['alias'], record['global'])
+
+        self._ready.set()
+        print(f"[CACHE] Tag cache was built with {len(tags)} tags and {len(aliases)} aliases.")
+
+    def _add_tag(self, record):
+        tag = dict(record)
+        tag['uses'] = (tag['uses'] or 0) + self._pending_uses[tag['id']]
+        self._tags[tag['id']] = tag
+
+    def _add_alias(self, tag_id: int, guild_id: int, alias: str, is_global: bool):
+        if is_global:
+            self._global_aliases[alias] = tag_id
+
+        self._guild_aliases[(guild_id, alias)] = tag_id
+        self._aliases_of[tag_id].add((guild_id, alias, is_global))
+
+    def get(self, alias: str, guild_id: typing.Optional[int]) -> typing.Optional[dict]:
+        """Returns the global tag, or if there is none, the tag of that guild that has alias as name or alias"""
+
+        alias = alias.lower()
+        tag_id = self._global_aliases.get(alias)
+
+        if tag_id is None and guild_id is not None:
+            tag_id = self._guild_aliases.get((guild_id, alias))
+
+        if tag_id is None:
+            return None
+
+        return self._tags.get(tag_id)
+
+    def is_global_alias(self, alias: str) -> bool:
+        return alias.lower() in self._global_aliases
+
+    def is_guild_alias(self, alias: str, guild_id: int) -> bool:
+        return (guild_id, alias.lower()) in self._guild_aliases
+
+    def get_tags(self, predicate: typing.Callable[[dict], bool]) -> typing.List[dict]:
+        """Returns all tags that predicate is true for, most used first"""
+        return sorted(filter(predicate, self._tags.values()), key=lambda tag: tag['uses'], reverse=True)
+
+    def get_uses(self, tag_id: int, default: int = 0) -> int:
+        tag = self._tags.get(tag_id)
+        return tag['uses'] if tag is not None else default
+
+    def record_use(self, tag: dict):
+        tag['uses'] += 1
+        self._pending_uses[tag['id']] += 1
+
+    async def flush_uses(self):
+        """Adds all uses since the last flush to guild_tags with a single statement"""
+
+        if not self._pending_uses:
+            return
+
+        pending, self._pending_uses = self._pending_uses, collections.Counter()
+
+        try:
+            await self.bot.db.execute("""UPDATE guild_tags SET uses = COALESCE(guild_tags.uses, 0) + pending.uses
+                                         FROM unnest($1::int[], $2::int[]) AS pending(id, uses)
+                                         WHERE guild_tags.id = pending.id""",
+                                      list(pending.keys()), list(pending.values()))
+        except Exception:
+            # Try again with the next flush
+            self._pending_uses.update(pending)
+            raise
+
+    @tasks.loop(minutes=1)
+    async def flush_uses_task(self):
+        # Loop.error() needs discord.py 1.4, so errors are handled here to keep the loop running
+        try:
+            await self.flush_uses()
+        except Exception as e:
+            print(f"[CACHE] Error while saving tag uses: {e.__class__.__name__}: {e}")
+
+    @flush_uses_task.before_loop
+    async def before_flush_uses_task(self):
+        await self.bot.wait_until_ready()
+
+    def remove(self, tag_id: int):
+        self._pending_uses.pop(tag_id, None)
+        self._remove_cached(tag_id)
+
+    def _remove_cached(self, tag_id: int):
+        self._tags.pop(tag_id, None)
+
+        for guild_id, alias, is_global in self._aliases_of.pop(tag_id, ()):
+            if is_global and self._global_aliases.get(alias) == tag_id:
+                del self._global_aliases[alias]
+
+            if self._guild_aliases.get((guild_id, alias)) == tag_id:
+                del self._guild_aliases[(guild_id, alias)]
+
+    async def refresh(self, tag_id: int):
+        """Reloads a tag and its aliases from the database after they were changed"""
+
+        tag = await self.bot.db.fetchrow("SELECT * FROM guild_tags WHERE id = $1", tag_id)
+        aliases = await self.bot.db.fetch("SELECT guild_id, alias, global FROM guild_tags_alias WHERE tag_id = $1",
+                                          tag_id)
+
+        self._remove_cached(tag_id)
+
+        if tag is None:
+            return
+
+        self._add_tag(tag)
+
+        for record in aliases:
+            self._add_alias(tag_id, record['guild_id'], record['alias'], record['global'])
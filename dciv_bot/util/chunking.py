@@ -0,0 +1,102 @@
+import typing
+
+# Limits of the Discord API
+MESSAGE_LIMIT = 2000
+FIELD_VALUE_LIMIT = 1024
+EMBED_LIMIT = 6000
+EMBED_FIELD_AMOUNT_LIMIT = 25
+
+_CODE_BLOCK = '```'
+
+# Lines are wrapped this much shorter than the limit, so that there's always room to close and reopen a code block
+_CODE_BLOCK_ROOM = 32
+
+
+def _wrap(line: str, width: int) -> typing.Iterator[str]:
+    """Splits a line that is longer than width, preferably at whitespace"""
+
+    while len(line) > width:
+        cut = line.rfind(' ', 0, width)
+
+        if cut <= 0:
+            cut = width
+
+        yield line[:cut]
+        line = line[cut:].lstrip(' ')
+
+    yield line
+
+
+def chunk_text(text: typing.Union[str, typing.Iterable[str]], limit: int = MESSAGE_LIMIT) -> typing.List[str]:
+    """Packs the lines of text into as few chunks of at most limit characters as possible in a single pass.
+
+    Lines are only split if they are longer than a chunk on their own. If a chunk ends inside a code block, the code
+    block is closed at the end of it and reopened at the start of the next one."""
+
+    lines = text.splitlines() if isinstance(text, str) else text
+    width = limit - _CODE_BLOCK_ROOM
+
+    chunks = []
+    current = []
+    size = 0
+    code_block = None  # The line that opened the current code block, i.e. ```py
+
+    for long_line in lines:
+        for line in _wrap(long_line, width):
+            if line.lstrip().startswith(_CODE_BLOCK):
+                code_block_after = None if code_block else line.strip()
+            else:
+                code_block_after = code_block
+
+            needed = size + len(line) + (1 if current else 0) + (len(_CODE_BLOCK) + 1 if code_block_after else 0)
+
+            if current and needed > limit:
+                if code_block:
+                    current.append(_CODE_BLOCK)
+
+                chunks.append('\n'.join(current))
+                current = [code_block] if code_block else []
+                size = len(code_block) if code_block else 0
+
+            size += len(line) + (1 if current else 0)
+            current.append(line)
+            code_block = code_block_after
+
+    if current:
+        if code_block:
+            current.append(_CODE_BLOCK)
+
+        chunks.append('\n'.join(current))
+
+    return chunks
+
+
+def chunk_message(text: typing.Union[str, typing.Iterable[str]]) -> typing.List[str]:
+    """Splits text into chunks that can be sent as separate Discord messages"""
+    return chunk_text(text, MESSAGE_LIMIT)
+
+
+def chunk_field_value(text: typing.Union[str, typing.Iterable[str]]) -> typing.List[str]:
+    """Splits text into chunks that each fit into the value of an embed field"""
+    return chunk_text(text, FIELD_VALUE_LIMIT)
+
+
+def add_embed_fields(embed, name: str, value: str, *, continued_name: str = None, inline: bool = False) -> bool:
+    """Adds value to the embed, split into as many fields as needed. The first field is called name, all others
+    continued_name, which defaults to "name (cont.)".
+
+    If the fields would make the embed exceed Discord's limits, nothing is added and False is returned."""
+
+    chunks = chunk_field_value(value) or ['-']
+    continued_name = continued_name or f"{name} (cont.)"
+
+    names = [name] + [continued_name] * (len(chunks) - 1)
+    added_length = sum(len(n) for n in names) + sum(len(chunk) for chunk in chunks)
+
+    if len(embed) + added_length > EMBED_LIMIT or len(embed.fields) + len(chunks) > EMBED_FIELD_AMOUNT_LIMIT:
+        return False
+
+    for field_name, chunk in zip(names, chunks):
+        embed.add_field(name=field_name, value=chunk, inline=inline)
+
+    return True
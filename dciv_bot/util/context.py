@@ -0,0 +1,35 @@
+import typing
+
+from discord.ext import commands
+
+
+class IdentityMap:
+    """Keeps track of the sessions, bills, laws and motions that were already loaded from the database during a
+    single command invocation, so that every row is only converted once per command."""
+
+    def __init__(self):
+        self._objects: typing.Dict[typing.Tuple[type, int], typing.Any] = dict()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(self, model: type, _id: int):
+        return self._objects.get((model, _id))
+
+    def add(self, obj):
+        self._objects[(type(obj), obj.id)] = obj
+        return obj
+
+    def discard(self, model: type, _id: int):
+        self._objects.pop((model, _id), None)
+
+    def clear(self):
+        self._objects.clear()
+
+
+class CustomContext(commands.Context):
+    """Context with a per-invocation identity map that the legislative converters share."""
+
+    def __init__(self, **attrs):
+        super().__init__(**attrs)
+        self.identity_map = IdentityMap()
@@ -321,14 +321,49 @@ class OwnedTag(Tag):
                    is_embedded=is_embedded, invoked_with=argument.lower())
 
 
+def get_loaded_object(ctx, model: type, _id: int):
+    """Returns the session, bill, law or motion with that ID if it was already loaded during this command or is
+    still in the process-wide cache of LawUtils, otherwise None."""
+
+    obj = ctx.identity_map.get(model, _id)
+
+    if obj is None:
+        obj = ctx.bot.laws.cache.get((model, _id))
+
+        if obj is not None:
+            ctx.identity_map.add(obj)
+
+    return obj
+
+
+def register_loaded_object(ctx, obj):
+    """Remembers a freshly loaded session, bill, law or motion for the rest of this command. Objects that belong to
+    a closed session are kept in the process-wide cache of LawUtils as well."""
+
+    ctx.identity_map.add(obj)
+
+    if obj.is_archived:
+        ctx.bot.laws.cache.put((type(obj), obj.id), obj)
+
+    return obj
+
+
 class Session(commands.Converter):
     """
     Represents a session of the Legislature.
 
         The lookup strategy for the converter is as follows (in order):
             1. Lookup by ID.
+
+    The IDs of the session's bills and motions are only queried once `Session.bills` or `Session.motions` is
+    awaited for the first time, unless the session was converted with `prefetch=True`.
     """
 
+    # Columns that load the IDs of a session's bills and motions in the same query as the session itself
+    prefetch_columns = """ARRAY(SELECT b.id FROM legislature_bills b WHERE b.leg_session = s.id ORDER BY b.id) AS bills,
+                          ARRAY(SELECT m.id FROM legislature_motions m WHERE m.leg_session = s.id ORDER BY m.id)
+                          AS motions"""
+
     def __init__(self, **kwargs):
         self.id: int = kwargs.get('id')
         self.is_active: bool = kwargs.get('is_active')
@@ -337,8 +372,8 @@ class Session(commands.Converter):
         self.opened_on: datetime = kwargs.get('opened_on')
         self.voting_started_on: datetime = kwargs.get('voting_started_on', None)
         self.closed_on: datetime = kwargs.get('closed_on', None)
-        self.bills: typing.List[int] = kwargs.get('bills')
-        self.motions: typing.List[int] = kwargs.get('motions')
+        self._bills: typing.Optional[typing.List[int]] = kwargs.get('bills')
+        self._motions: typing.Optional[typing.List[int]] = kwargs.get('motions')
         self._speaker: int = kwargs.get('speaker')
         self._bot = kwargs.get('bot')
 
@@ -347,17 +382,59 @@ class Session(commands.Converter):
         user = self._bot.democraciv_guild_object.get_member(self._speaker) or self._bot.get_user(self._speaker)
         return user
 
+    @property
+    def is_archived(self) -> bool:
+        return not self.is_active
+
+    @property
+    def bills(self) -> typing.Awaitable[typing.List[int]]:
+        """The sorted IDs of all bills that were submitted during this session. Has to be awaited."""
+        return self._fetch_bills()
+
+    @property
+    def motions(self) -> typing.Awaitable[typing.List[int]]:
+        """The sorted IDs of all motions that were submitted during this session. Has to be awaited."""
+        return self._fetch_motions()
+
+    async def _fetch_bills(self) -> typing.List[int]:
+        if self._bills is None:
+            bills = await self._bot.db.fetch("SELECT id FROM legislature_bills WHERE leg_session = $1 ORDER BY id",
+                                             self.id)
+            self._bills = [record['id'] for record in bills]
+
+        return self._bills
+
+    async def _fetch_motions(self) -> typing.List[int]:
+        if self._motions is None:
+            motions = await self._bot.db.fetch("SELECT id FROM legislature_motions WHERE leg_session = $1 "
+                                               "ORDER BY id", self.id)
+            self._motions = [record['id'] for record in motions]
+
+        return self._motions
+
     async def start_voting(self, voting_form):
+        voting_started_on = datetime.utcnow()
+
         await self._bot.db.execute("UPDATE legislature_sessions SET status = 'Voting Period',"
                                    " voting_started_on = $2, vote_form = $3"
-                                   " WHERE id = $1", self.id, datetime.utcnow(), voting_form)
+                                   " WHERE id = $1", self.id, voting_started_on, voting_form)
+
+        self.status = SessionStatus.VOTING_PERIOD
+        self.voting_started_on = voting_started_on
+        self.vote_form = voting_form
 
     async def close(self):
+        closed_on = datetime.utcnow()
+
         await self._bot.db.execute("UPDATE legislature_sessions SET is_active = false, closed_on = $2,"
-                                   " status = 'Closed' WHERE id = $1", self.id, datetime.utcnow())
+                                   " status = 'Closed' WHERE id = $1", self.id, closed_on)
+
+        self.is_active = False
+        self.status = SessionStatus.CLOSED
+        self.closed_on = closed_on
 
     @classmethod
-    async def convert(cls, ctx, argument: typing.Union[int, str]):
+    async def convert(cls, ctx, argument: typing.Union[int, str], prefetch: bool = False):
         if isinstance(argument, str):
             if argument.lower() == "all":
                 return argument
@@ -367,22 +444,51 @@ class Session(commands.Converter):
                 except ValueError:
                     raise BadArgument(f":x: {argument} is neither a number nor 'all'.")
 
-        session = await ctx.bot.db.fetchrow("SELECT * FROM legislature_sessions WHERE id = $1", argument)
+        cached = get_loaded_object(ctx, cls, argument)
+
+        if cached is not None:
+            return cached
+
+        if prefetch:
+            query = f"SELECT s.*, {cls.prefetch_columns} FROM legislature_sessions s WHERE s.id = $1"
+        else:
+            query = "SELECT * FROM legislature_sessions WHERE id = $1"
+
+        session = await ctx.bot.db.fetchrow(query, argument)
 
         if session is None:
             raise NotFoundError(f":x: There is no session with ID #{argument}.")
 
-        bills = await ctx.bot.db.fetch("SELECT id FROM legislature_bills WHERE leg_session = $1", session['id'])
-        bills = sorted([record['id'] for record in bills])
+        return register_loaded_object(ctx, cls.from_record(ctx, session))
+
+    @classmethod
+    def from_record(cls, ctx, record):
+        return cls(id=record['id'], is_active=record['is_active'],
+                   status=SessionStatus.from_str(record['status']),
+                   vote_form=record['vote_form'], opened_on=record['opened_on'],
+                   voting_started_on=record['voting_started_on'], closed_on=record['closed_on'],
+                   speaker=record['speaker'], bills=record.get('bills'), motions=record.get('motions'), bot=ctx.bot)
+
+    @classmethod
+    async def convert_many(cls, ctx, ids: typing.Iterable[int], prefetch: bool = False) -> typing.List['Session']:
+        """Loads multiple sessions at once with a single query. The returned list has the same order as `ids`,
+        IDs that don't exist are skipped."""
+
+        ids = [int(_id) for _id in ids]
+        missing = [_id for _id in ids if get_loaded_object(ctx, cls, _id) is None]
 
-        motions = await ctx.bot.db.fetch("SELECT id FROM legislature_motions WHERE leg_session = $1", session['id'])
-        motions = sorted([record['id'] for record in motions])
+        if missing:
+            if prefetch:
+                query = f"SELECT s.*, {cls.prefetch_columns} FROM legislature_sessions s " \
+                        f"WHERE s.id = ANY($1::int[])"
+            else:
+                query = "SELECT * FROM legislature_sessions WHERE id = ANY($1::int[])"
 
-        return cls(id=session['id'], is_active=session['is_active'],
-                   status=SessionStatus.from_str(session['status']),
-                   vote_form=session['vote_form'], opened_on=session['opened_on'],
-                   voting_started_on=session['voting_started_on'], closed_on=session['closed_on'],
-                   speaker=session['speaker'], bills=bills, motions=motions, bot=ctx.bot)
+            for record in await ctx.bot.db.fetch(query, missing):
+                register_loaded_object(ctx, cls.from_record(ctx, record))
+
+        sessions = [get_loaded_object(ctx, cls, _id) for _id in ids]
+        return [session for session in sessions if session is not None]
 
 
 class Bill(commands.Converter):
@@ -423,6 +529,10 @@ class Bill(commands.Converter):
         else:
             return self.name
 
+    @property
+    def is_archived(self) -> bool:
+        return self.session.is_archived
+
     async def is_law(self) -> bool:
         found = await self._bot.db.fetchval("SELECT law_id FROM legislature_laws WHERE bill_id = $1", self.id)
 
@@ -433,49 +543,113 @@ class Bill(commands.Converter):
 
     async def withdraw(self):
         await self._bot.db.execute("DELETE FROM legislature_bills WHERE id = $1", self.id)
+        self._bot.laws.invalidate(Bill, self.id)
 
-    async def pass_from_legislature(self):
-        await self._bot.db.execute("UPDATE legislature_bills SET status = $1 WHERE id = $2",
-                                   BillStatus.LEG_PASSED.value,
-                                   self.id)
+        if self._bot.laws.statistics is not None:
+            self._bot.laws.statistics.bill_withdrawn(self._submitter)
+
+    async def pass_from_legislature(self) -> typing.List[int]:
+        return await Bill.pass_many_from_legislature(self._bot, [self])
 
     async def veto(self):
-        await self._bot.db.execute("UPDATE legislature_bills SET status = $1 WHERE id = $2",
-                                   BillStatus.MIN_FAILED.value,
-                                   self.id)
-
-    async def pass_into_law(self, override: bool = False):
-        if self.is_vetoable and not override:
-            await self._bot.db.execute("UPDATE legislature_bills SET status = $1 WHERE id = $2",
-                                       BillStatus.MIN_PASSED.value,
-                                       self.id)
+        await Bill.veto_many(self._bot, [self])
+
+    async def pass_into_law(self, override: bool = False) -> int:
+        law_ids = await Bill.pass_many_into_law(self._bot, [self], override=override)
+        return law_ids[0]
+
+    @classmethod
+    async def pass_many_from_legislature(cls, bot, bills: typing.List['Bill']) -> typing.List[int]:
+        """Marks all bills as passed from the Legislature and passes those that are not vetoable into law right away,
+        all in one transaction. Returns the ids of the new laws."""
+
+        if not bills:
+            return []
+
+        into_law = [bill for bill in bills if not bill.is_vetoable]
+        tags = await bot.laws.generate_law_tags_many(into_law) if into_law else []
+
+        async with bot.db.acquire() as con:
+            async with con.transaction():
+                await con.execute("UPDATE legislature_bills SET status = $1 WHERE id = ANY($2::int[])",
+                                  BillStatus.LEG_PASSED.value, [bill.id for bill in bills])
+                law_ids = await cls._insert_laws(bot, con, into_law, tags)
+
+        for bill in bills:
+            bill.status = BillStatus.LEG_PASSED
+
+        cls._on_laws_passed(bot, law_ids, into_law, tags)
+        return law_ids
+
+    @classmethod
+    async def veto_many(cls, bot, bills: typing.List['Bill']):
+        if not bills:
+            return
+
+        await bot.db.execute("UPDATE legislature_bills SET status = $1 WHERE id = ANY($2::int[])",
+                             BillStatus.MIN_FAILED.value, [bill.id for bill in bills])
+
+        for bill in bills:
+            bill.status = BillStatus.MIN_FAILED
+
+    @classmethod
+    async def pass_many_into_law(cls, bot, bills: typing.List['Bill'], override: bool = False) -> typing.List[int]:
+        """Passes all bills into law in one transaction, returns the ids of the new laws in the same order as bills.
+
+        The tags of all bills are generated in one batch in LawUtils' process pool and saved with a single insert."""
+
+        if not bills:
+            return []
+
         if override:
-            await self._bot.db.execute("UPDATE legislature_bills SET status = $1 WHERE id = $2",
-                                       BillStatus.VETO_OVERRIDDEN.value,
-                                       self.id)
+            status, to_update = BillStatus.VETO_OVERRIDDEN, bills
+        else:
+            status, to_update = BillStatus.MIN_PASSED, [bill for bill in bills if bill.is_vetoable]
+
+        # Generating the tags is the slow part, so it's done before the transaction is opened
+        tags = await bot.laws.generate_law_tags_many(bills)
 
-        law_id = await self._bot.db.fetchval("INSERT INTO legislature_laws (bill_id, passed_on)"
-                                             " VALUES ($1, $2) RETURNING law_id",
-                                             self.id, datetime.utcnow())
+        async with bot.db.acquire() as con:
+            async with con.transaction():
+                if to_update:
+                    await con.execute("UPDATE legislature_bills SET status = $1 WHERE id = ANY($2::int[])",
+                                      status.value, [bill.id for bill in to_update])
 
-        # The bot takes the submitter-provided description (from the -legislature submit command) *and* the description
-        # from Google Docs (og:description property in HTML, usually the title of the Google Doc and the first
-        # few sentence's of content.) and tokenizes those with nltk. Then, every noun from both descriptions is saved
-        # into the legislature_tags table with the corresponding law_id.
+                law_ids = await cls._insert_laws(bot, con, bills, tags)
 
-        _tags = await self._bot.loop.run_in_executor(None, self._bot.laws.generate_law_tags,
-                                                     self.google_docs_description, self.description)
+        for bill in to_update:
+            bill.status = status
 
-        name_abbreviation = "".join([c[0].lower() for c in self.name.split()])
+        cls._on_laws_passed(bot, law_ids, bills, tags)
+        return law_ids
 
-        if self.name.lower().startswith("the"):
-            _tags.append(name_abbreviation[1:])
+    @staticmethod
+    async def _insert_laws(bot, connection, bills: typing.List['Bill'],
+                           tags: typing.List[typing.List[str]]) -> typing.List[int]:
+        if not bills:
+            return []
+
+        records = await connection.fetch("INSERT INTO legislature_laws (bill_id, passed_on) "
+                                         "SELECT unnest($1::int[]), $2 RETURNING bill_id, law_id",
+                                         [bill.id for bill in bills], datetime.utcnow())
 
-        _tags.append(name_abbreviation)
+        law_ids = {record['bill_id']: record['law_id'] for record in records}
+        law_ids = [law_ids[bill.id] for bill in bills]
 
-        for tag in _tags:
-            await self._bot.db.execute("INSERT INTO legislature_tags (id, tag) VALUES ($1, $2) ON CONFLICT DO NOTHING",
-                                       law_id, tag.lower())
+        await bot.laws.add_law_tags(dict(zip(law_ids, tags)), connection=connection)
+        return law_ids
+
+    @staticmethod
+    def _on_laws_passed(bot, law_ids: typing.List[int], bills: typing.List['Bill'],
+                        tags: typing.List[typing.List[str]]):
+        if bot.laws.statistics is not None:
+            bot.laws.statistics.laws_passed(bill._submitter for bill in bills)
+
+        if bot.laws.search_index is None:
+            return
+
+        for law_id, bill, _tags in zip(law_ids, bills, tags):
+            bot.laws.search_index.add(law_id, bill.name, bill.link, bill.description, _tags)
 
     async def get_emojified_status(self, verbose: bool = True) -> str:
         if self.status is BillStatus.SUBMITTED:
@@ -546,6 +720,12 @@ class Bill(commands.Converter):
     async def convert(cls, ctx, argument: typing.Union[int, str]):
         try:
             argument = int(argument)
+
+            cached = get_loaded_object(ctx, cls, argument)
+
+            if cached is not None:
+                return cached
+
             bill = await ctx.bot.db.fetchrow("SELECT * FROM legislature_bills WHERE id = $1", argument)
         except ValueError:
             bill = await ctx.bot.db.fetchrow("SELECT * FROM legislature_bills WHERE"
@@ -555,12 +735,40 @@ class Bill(commands.Converter):
         if bill is None:
             raise NotFoundError(f":x: There is no bill that matches `{argument}`.")
 
+        cached = get_loaded_object(ctx, cls, bill['id'])
+
+        if cached is not None:
+            return cached
+
         session = await Session.convert(ctx, bill['leg_session'])
+        return register_loaded_object(ctx, cls.from_record(ctx, bill, session=session))
 
-        return cls(id=bill['id'], name=bill['bill_name'], link=bill['link'], tiny_link=bill['tiny_link'],
-                   description=bill['description'], is_vetoable=bill['is_vetoable'],
-                   session=session, submitter=bill['submitter'], status=BillStatus(bill['status']),
-                   google_docs_description=bill['google_docs_description'], bot=ctx.bot)
+    @classmethod
+    def from_record(cls, ctx, record, *, session: Session):
+        return cls(id=record['id'], name=record['bill_name'], link=record['link'], tiny_link=record['tiny_link'],
+                   description=record['description'], is_vetoable=record['is_vetoable'],
+                   session=session, submitter=record['submitter'], status=BillStatus(record['status']),
+                   repealed_on=record['repealed_on'], google_docs_description=record['google_docs_description'],
+                   bot=ctx.bot)
+
+    @classmethod
+    async def convert_many(cls, ctx, ids: typing.Iterable[int]) -> typing.List['Bill']:
+        """Loads multiple bills and their sessions at once with a constant amount of queries. The returned list has
+        the same order as `ids`, IDs that don't exist are skipped."""
+
+        ids = [int(_id) for _id in ids]
+        missing = [_id for _id in ids if get_loaded_object(ctx, cls, _id) is None]
+
+        if missing:
+            records = await ctx.bot.db.fetch("SELECT * FROM legislature_bills WHERE id = ANY($1::int[])", missing)
+            sessions = await Session.convert_many(ctx, {record['leg_session'] for record in records})
+            sessions = {session.id: session for session in sessions}
+
+            for record in records:
+                register_loaded_object(ctx, cls.from_record(ctx, record, session=sessions[record['leg_session']]))
+
+        bills = [get_loaded_object(ctx, cls, _id) for _id in ids]
+        return [bill for bill in bills if bill is not None]
 
 
 class Law(commands.Converter):
@@ -590,13 +798,43 @@ class Law(commands.Converter):
 
         return await cls.convert(ctx, law)
 
+    @property
+    def is_archived(self) -> bool:
+        return self.bill.is_archived
+
     async def repeal(self):
-        await self._bot.db.execute("UPDATE legislature_bills SET status = $1, repealed_on = $2 WHERE id = $3",
-                                   BillStatus.REPEALED.value,
-                                   datetime.utcnow(),
-                                   self.bill.id)
+        await Law.repeal_many(self._bot, [self])
 
-        await self._bot.db.execute("DELETE FROM legislature_laws WHERE law_id = $1", self.id)
+    @classmethod
+    async def repeal_many(cls, bot, laws: typing.List['Law']):
+        """Repeals all laws in one transaction"""
+
+        if not laws:
+            return
+
+        repealed_on = datetime.utcnow()
+
+        async with bot.db.acquire() as con:
+            async with con.transaction():
+                await con.execute("UPDATE legislature_bills SET status = $1, repealed_on = $2"
+                                  " WHERE id = ANY($3::int[])",
+                                  BillStatus.REPEALED.value, repealed_on, [law.bill.id for law in laws])
+                await con.execute("DELETE FROM legislature_laws WHERE law_id = ANY($1::int[])",
+                                  [law.id for law in laws])
+
+        for law in laws:
+            law.bill.status = BillStatus.REPEALED
+            law.bill.repealed_on = repealed_on
+
+            # The cache might hold another copy of the bill if it was evicted and loaded again in the meantime
+            bot.laws.invalidate(Law, law.id)
+            bot.laws.invalidate(Bill, law.bill.id)
+
+            if bot.laws.search_index is not None:
+                bot.laws.search_index.remove(law.id)
+
+        if bot.laws.statistics is not None:
+            bot.laws.statistics.laws_repealed(law.bill._submitter for law in laws)
 
     async def amend(self, new_link: str):
         tiny_url = await self._bot.laws.post_to_tinyurl(new_link)
@@ -608,10 +846,24 @@ class Law(commands.Converter):
         await self._bot.db.execute("UPDATE legislature_bills SET link = $1, tiny_link = $2 WHERE id = $3",
                                    new_link, tiny_url, self.bill.id)
 
+        self.bill.link = new_link
+        self.bill.tiny_link = tiny_url
+        self._bot.laws.invalidate(Law, self.id)
+        self._bot.laws.invalidate(Bill, self.bill.id)
+
+        if self._bot.laws.search_index is not None:
+            self._bot.laws.search_index.update_link(self.id, new_link)
+
     @classmethod
     async def convert(cls, ctx, argument: typing.Union[int, str]):
         try:
             argument = int(argument)
+
+            cached = get_loaded_object(ctx, cls, argument)
+
+            if cached is not None:
+                return cached
+
             law = await ctx.bot.db.fetchrow("SELECT * FROM legislature_laws WHERE law_id = $1", argument)
         except ValueError:
             query = """SELECT law_id FROM legislature_laws AS l
@@ -621,6 +873,11 @@ class Law(commands.Converter):
             law_id = await ctx.bot.db.fetchval(query, argument, argument.lower())
 
             if law_id:
+                cached = get_loaded_object(ctx, cls, law_id)
+
+                if cached is not None:
+                    return cached
+
                 law = await ctx.bot.db.fetchrow("SELECT * FROM legislature_laws WHERE law_id = $1", law_id)
             else:
                 law = None
@@ -636,7 +893,8 @@ class Law(commands.Converter):
         tags = await ctx.bot.db.fetch("SELECT * FROM legislature_tags WHERE id = $1", law['law_id'])
         tags = [record['tag'] for record in tags]
 
-        return cls(id=law['law_id'], bill=bill, tags=tags, passed_on=law['passed_on'], bot=ctx.bot)
+        return register_loaded_object(ctx, cls(id=law['law_id'], bill=bill, tags=tags, passed_on=law['passed_on'],
+                                        bot=ctx.bot))
 
 
 class Motion(commands.Converter):
@@ -671,6 +929,10 @@ class Motion(commands.Converter):
         else:
             return self.title
 
+    @property
+    def is_archived(self) -> bool:
+        return self.session.is_archived
+
     @property
     def link(self) -> str:
         # If the motion's description is just a Google Docs link, use that link instead of the Hastebin
@@ -680,6 +942,10 @@ class Motion(commands.Converter):
 
     async def withdraw(self):
         await self._bot.db.execute("DELETE FROM legislature_motions WHERE id = $1", self.id)
+        self._bot.laws.invalidate(Motion, self.id)
+
+        if self._bot.laws.statistics is not None:
+            self._bot.laws.statistics.motion_withdrawn()
 
     @classmethod
     async def convert(cls, ctx, argument: int):
@@ -688,15 +954,42 @@ class Motion(commands.Converter):
         except ValueError:
             raise BadArgument(f":x: {argument} is not a number.")
 
+        cached = get_loaded_object(ctx, cls, argument)
+
+        if cached is not None:
+            return cached
+
         motion = await ctx.bot.db.fetchrow("SELECT * FROM legislature_motions WHERE id = $1", argument)
 
         if motion is None:
             raise NotFoundError(f":x: There is no motion with ID #{argument}.")
 
         session = await Session.convert(ctx, motion['leg_session'])
+        return register_loaded_object(ctx, cls.from_record(ctx, motion, session=session))
+
+    @classmethod
+    def from_record(cls, ctx, record, *, session: Session):
+        return cls(id=record['id'], title=record['title'], link=record['hastebin'], description=record['description'],
+                   session=session, submitter=record['submitter'], bot=ctx.bot)
+
+    @classmethod
+    async def convert_many(cls, ctx, ids: typing.Iterable[int]) -> typing.List['Motion']:
+        """Loads multiple motions and their sessions at once with a constant amount of queries. The returned list
+        has the same order as `ids`, IDs that don't exist are skipped."""
+
+        ids = [int(_id) for _id in ids]
+        missing = [_id for _id in ids if get_loaded_object(ctx, cls, _id) is None]
+
+        if missing:
+            records = await ctx.bot.db.fetch("SELECT * FROM legislature_motions WHERE id = ANY($1::int[])", missing)
+            sessions = await Session.convert_many(ctx, {record['leg_session'] for record in records})
+            sessions = {session.id: session for session in sessions}
+
+            for record in records:
+                register_loaded_object(ctx, cls.from_record(ctx, record, session=sessions[record['leg_session']]))
 
-        return cls(id=motion['id'], title=motion['title'], link=motion['hastebin'], description=motion['description'],
-                   session=session, submitter=motion['submitter'], bot=ctx.bot)
+        motions = [get_loaded_object(ctx, cls, _id) for _id in ids]
+        return [motion for motion in motions if motion is not None]
 
 
 class PoliticalParty(commands.Converter):
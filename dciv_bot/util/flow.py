@@ -15,7 +15,7 @@ class Flow:
         self.ctx = ctx
 
     async def get_emoji_choice(self, yes_emoji: str, no_emoji: str,
-                               message: discord.Message, timeout: int) -> (discord.Reaction,
+                               message: discord.Message, timeout: int) -> (discord.PartialEmoji,
                                                                            typing.Union[discord.User, discord.Member]):
         """Adds the two specified emoji to the message and returns which one has been clicked by the
            original user in the specified time"""
@@ -24,16 +24,15 @@ class Flow:
         await message.add_reaction(no_emoji)
 
         try:
-            reaction, user = await self.ctx.bot.wait_for('reaction_add',
-                                                         check=self.bot.checks.wait_for_reaction_check(self.ctx,
-                                                                                                       message),
-                                                         timeout=timeout)
+            payload = await self.bot.reactions.wait_for(message.id,
+                                                        check=self.bot.checks.wait_for_reaction_check(self.ctx),
+                                                        timeout=timeout)
         except asyncio.TimeoutError:
             await self.ctx.send(":zzz: You took too long to react.")
             return None, None
 
         else:
-            return reaction, user
+            return payload.emoji, self.ctx.author
 
     async def gear_reaction_confirm(self, message: discord.Message, timeout: int) -> bool:
         """Adds the :gear: emoji to the message and returns whether it has been clicked by the
@@ -45,9 +44,10 @@ class Flow:
         await message.add_reaction(emoji)
 
         try:
-            await self.ctx.bot.wait_for('reaction_add',
-                                        check=self.bot.checks.wait_for_specific_emoji_reaction_check(self.ctx, message, emoji),
-                                        timeout=timeout)
+            await self.bot.reactions.wait_for(message.id,
+                                              check=self.bot.checks.wait_for_specific_emoji_reaction_check(self.ctx,
+                                                                                                           emoji),
+                                              timeout=timeout)
 
         except asyncio.TimeoutError:
             return False
@@ -68,22 +68,18 @@ class Flow:
         await message.add_reaction(no_emoji)
 
         try:
-            reaction, user = await self.ctx.bot.wait_for('reaction_add',
-                                                         check=self.bot.checks.wait_for_reaction_check(self.ctx,
-                                                                                                       message),
-                                                         timeout=timeout)
+            payload = await self.bot.reactions.wait_for(message.id,
+                                                        check=self.bot.checks.wait_for_reaction_check(self.ctx),
+                                                        timeout=timeout)
         except asyncio.TimeoutError:
             await self.ctx.send(":zzz: You took too long to react.")
             return None
 
         else:
-            if reaction is None:
-                return None
-
-            if str(reaction.emoji) == yes_emoji:
+            if str(payload.emoji) == yes_emoji:
                 return True
 
-            elif str(reaction.emoji) == no_emoji:
+            elif str(payload.emoji) == no_emoji:
                 return False
 
     async def get_new_channel(self, timeout: int) -> typing.Union[discord.TextChannel, str, None]:
@@ -162,7 +162,8 @@ class HelpPaginator(Pages):
 
         while self.paginating:
             try:
-                payload = await self.bot.wait_for('raw_reaction_add', check=self.react_check, timeout=120.0)
+                payload = await self.bot.reactions.wait_for(self.message.id, check=self.react_check,
+                                                            timeout=120.0)
             except asyncio.TimeoutError:
                 self.paginating = False
                 try:
@@ -1,86 +1,358 @@
-import copy
 import nltk
 import typing
+import asyncio
+import aiohttp
 import discord
 import asyncpg
 import datetime
 import collections
+import concurrent.futures
 
-from discord.ext import tasks
 from bs4 import BeautifulSoup, SoupStrainer
 
-from dciv_bot.util import mk
+from dciv_bot.util import mk, exceptions
+from dciv_bot.config import config
+from dciv_bot.util.cache import LRUCache, CacheInfo
+from dciv_bot.util.chunking import chunk_message, MESSAGE_LIMIT
+from dciv_bot.util.context import IdentityMap
+from dciv_bot.util.search_index import LawSearchIndex
 from dciv_bot.util.converter import Session, Bill, Law
 
 
 class MockContext:
     def __init__(self, bot):
         self.bot = bot
+        self.identity_map = IdentityMap()
+
+
+_pos_tagger = None
+
+
+def load_nltk_data():
+    """Loads the models nltk needs for generate_law_tags() from the local NLTK_DATA_DIR the first time it's called.
+    Run `python -m nltk.downloader -d <NLTK_DATA_DIR> punkt averaged_perceptron_tagger` once to fill that directory."""
+
+    global _pos_tagger
+
+    if _pos_tagger is not None:
+        return _pos_tagger
+
+    if config.NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, config.NLTK_DATA_DIR)
+
+    # nltk.pos_tag() would unpickle the tagger again on every call, so we keep our own instance around
+    _pos_tagger = nltk.tag.PerceptronTagger()
+    return _pos_tagger
+
+
+def generate_law_tags(google_docs_description: str, author_description: str,
+                      illegal_tags: typing.Iterable[str]) -> typing.List[str]:
+    """Generates tags from all nouns of submitter-provided description and the Google Docs description"""
+
+    tagger = load_nltk_data()
+
+    # Function to check if token is noun
+    is_noun = lambda pos: pos[:2] == 'NN'
+
+    # Tokenize both descriptions
+    tokenized_docs_description = nltk.word_tokenize(google_docs_description)
+    tokenized_author_description = nltk.word_tokenize(author_description)
+
+    # Add all nouns to list
+    tags = [word for (word, pos) in tagger.tag(tokenized_docs_description) +
+            tagger.tag(tokenized_author_description) if is_noun(pos) and
+            len(word) >= 3 and
+            word.lower() not in illegal_tags]
+
+    # Eliminate duplicate tags
+    tags = list(set(tags))
+
+    return tags
+
+
+def generate_tags_for_bills(bills: typing.List[typing.Tuple[str, str, str]],
+                            illegal_tags: typing.Iterable[str]) -> typing.List[typing.List[str]]:
+    """Generates the tags for a batch of bills given as (name, google_docs_description, description) tuples. Runs in
+    LawUtils' process pool, so it only gets and returns plain data."""
+
+    # The bot takes the submitter-provided description (from the -legislature submit command) *and* the description
+    # from Google Docs (og:description property in HTML, usually the title of the Google Doc and the first
+    # few sentence's of content.) and tokenizes those with nltk. Every noun from both descriptions and the
+    # abbreviation of the bill's name become the law's tags.
+
+    all_tags = []
+
+    for name, google_docs_description, description in bills:
+        tags = generate_law_tags(google_docs_description, description, illegal_tags)
+        name_abbreviation = "".join([c[0].lower() for c in name.split()])
+
+        if name.lower().startswith("the"):
+            tags.append(name_abbreviation[1:])
+
+        tags.append(name_abbreviation)
+        all_tags.append(tags)
+
+    return all_tags
 
 
 class AnnouncementQueue:
+    """One kind of announcement, i.e. passed bills or repealed laws. Every object added to it is rendered into a line
+    right away and stored in the announcement_outbox table, the AnnouncementScheduler later sends all pending lines of
+    a channel together, using get_header() and get_footer() of every queue that has pending lines."""
+
     def __init__(self, bot, channel):
         self.bot = bot
         self._channel: mk.DemocracivChannel = channel
-        self._objects: typing.List[typing.Union[Bill, Law, Session]] = []
-        self._last_addition = None
-        self._task = None
-
-    def __del__(self):
-        if self._task is not None:
-            self._task.cancel()
+        self.name = type(self).__name__
+        self.bot.announcements.register(self)
 
     @property
     def channel(self) -> typing.Optional[discord.TextChannel]:
         return mk.get_democraciv_channel(self.bot, self._channel)
 
-    def get_message(self) -> str:
+    def get_header(self) -> str:
         raise NotImplementedError()
 
-    def split_message(self, message: str) -> typing.List[str]:
-        lines = message.splitlines(keepends=True)
-        split_into_2000 = dict()
-        index = 0
+    def get_footer(self) -> typing.Optional[str]:
+        return None
 
-        for paragraph in lines:
-            try:
-                split_into_2000[index]
-            except KeyError:
-                split_into_2000[index] = ""
+    def format_object(self, obj: typing.Union[Bill, Law, Session]) -> str:
+        raise NotImplementedError()
 
-            split_into_2000[index] = split_into_2000[index] + ''.join(paragraph)
+    def get_message(self, lines: typing.List[str]) -> str:
+        message = [self.get_header(), *lines]
+        footer = self.get_footer()
 
-            if (len(''.join(split_into_2000[index]))) > 1900:
-                index += 1
+        if footer:
+            message.append(f"\n{footer}")
 
-        return list(split_into_2000.values())
+        return '\n'.join(message)
 
     def add(self, obj: typing.Union[Bill, Law, Session]):
-        if len(self._objects) == 0:
-            self._task = copy.copy(self._wait)
-            self._task.start()
+        self.bot.loop.create_task(self.bot.announcements.enqueue(self, self.format_object(obj)))
 
-        self._objects.append(obj)
-        self._last_addition = datetime.datetime.utcnow()
 
-    async def send_messages(self):
-        message = self.get_message()
+class AnnouncementScheduler:
+    """Sends the announcements of all AnnouncementQueues. Pending announcements are persisted in the
+    announcement_outbox table, so they survive restarts.
 
-        if len(message) > 2000:
-            split_messages = self.split_message(message)
-            for msg in split_messages:
-                await self.channel.send(msg)
-        else:
-            await self.channel.send(message)
-        self._objects.clear()
-        self._task.cancel()
+    Instead of polling, a single task sleeps until the next channel is due. A channel is due once nothing was added
+    to it for `delay`, then all of its pending announcements are coalesced into as few messages as possible."""
+
+    def __init__(self, bot, delay: datetime.timedelta = datetime.timedelta(minutes=10)):
+        self.bot = bot
+        self.delay = delay
+        self._queues: typing.Dict[str, AnnouncementQueue] = dict()
+        self._wakeup = asyncio.Event()
+        self._task = self.bot.loop.create_task(self._run())
+
+    def register(self, queue: AnnouncementQueue):
+        self._queues[queue.name] = queue
 
-    @tasks.loop(seconds=30)
-    async def _wait(self):
-        if self._last_addition is not None and \
-                datetime.datetime.utcnow() - self._last_addition > datetime.timedelta(minutes=10):
-            self._last_addition = None
-            await self.send_messages()
+    async def enqueue(self, queue: AnnouncementQueue, line: str, *, attempts: int = 3):
+        """Stores a line in the outbox, retrying with a growing delay if the database is briefly unavailable"""
+
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.bot.db.execute("INSERT INTO announcement_outbox (channel, queue, line, created_on) "
+                                          "VALUES ($1, $2, $3, $4)", queue._channel.name, queue.name, line,
+                                          datetime.datetime.utcnow())
+            except Exception as e:
+                print(f"[BOT] Error while saving announcement for {queue.name} (attempt {attempt}/{attempts}): "
+                      f"{e.__class__.__name__}: {e}")
+
+                if attempt == attempts:
+                    print(f"[BOT] Dropped announcement for {queue.name}: {line}")
+                    return
+
+                await asyncio.sleep(5 * attempt)
+            else:
+                self._wakeup.set()
+                return
+
+    def _batch_messages(self, lines_by_queue: typing.Dict[str, typing.List[typing.Tuple[int, str]]]) \
+            -> typing.List[typing.Tuple[str, typing.List[int]]]:
+        """Packs the pending (id, line) pairs of every queue into as few messages as possible. Every message is
+        returned together with the outbox ids of the lines in it. A line that doesn't fit into a message on its own is
+        split, its id is returned with the last part."""
+
+        batches = []
+        blocks: typing.List[typing.Tuple[AnnouncementQueue, typing.List[str]]] = []
+        ids = []
+        size = 0
+
+        def finish():
+            nonlocal blocks, ids, size
+
+            if blocks:
+                batches.append(('\n\n'.join(queue.get_message(lines) for queue, lines in blocks), ids))
+
+            blocks, ids, size = [], [], 0
+
+        for queue_name, records in lines_by_queue.items():
+            queue = self._queues[queue_name]
+            empty_size = len(queue.get_message([]))
+            block = None
+
+            for record_id, line in records:
+                # Every line adds itself and a newline, a new block adds its header, footer and a blank line
+                added = 1 + len(line) if block is not None else (2 if blocks else 0) + empty_size + 1 + len(line)
+
+                if size + added > MESSAGE_LIMIT:
+                    finish()
+                    block = None
+                    added = empty_size + 1 + len(line)
+
+                    if added > MESSAGE_LIMIT:
+                        *parts, last = chunk_message(queue.get_message([line]))
+                        batches.extend((part, []) for part in parts)
+                        batches.append((last, [record_id]))
+                        continue
+
+                if block is None:
+                    block = []
+                    blocks.append((queue, block))
+
+                block.append(line)
+                ids.append(record_id)
+                size += added
+
+        finish()
+        return batches
+
+    async def flush(self, channel_name: str):
+        """Sends all pending announcements of that channel and removes every message's lines from the outbox as soon as
+        that message was sent, so a failed send only retries what wasn't sent yet"""
+
+        records = await self.bot.db.fetch("SELECT id, queue, line FROM announcement_outbox WHERE channel = $1 "
+                                          "ORDER BY id", channel_name)
+
+        # Abuse dict as ordered set, so that the queues appear in the order of their first announcement
+        lines_by_queue: typing.Dict[str, typing.List[typing.Tuple[int, str]]] = dict()
+
+        for record in records:
+            if record['queue'] not in self._queues:
+                # The cog of that queue isn't loaded right now, keep its announcements for later
+                continue
+
+            lines_by_queue.setdefault(record['queue'], []).append((record['id'], record['line']))
+
+        if not lines_by_queue:
+            return
+
+        try:
+            channel = mk.get_democraciv_channel(self.bot, mk.DemocracivChannel[channel_name])
+        except exceptions.ChannelNotFoundError:
+            return
+
+        for message, sent_ids in self._batch_messages(lines_by_queue):
+            await channel.send(message)
+
+            if sent_ids:
+                await self.bot.db.execute("DELETE FROM announcement_outbox WHERE id = ANY($1::int[])", sent_ids)
+
+    async def _flush_due_channels(self) -> typing.Optional[float]:
+        """Flushes every channel that is due and returns the seconds until the next one is, or None if there are
+        no pending announcements"""
+
+        last_additions = await self.bot.db.fetch("SELECT channel, MAX(created_on) AS last_addition "
+                                                 "FROM announcement_outbox GROUP BY channel")
+        deadlines = []
+
+        for record in last_additions:
+            deadline = record['last_addition'] + self.delay
+
+            if deadline <= datetime.datetime.utcnow():
+                try:
+                    await self.flush(record['channel'])
+                except Exception as e:
+                    print(f"[BOT] Error while sending announcements to {record['channel']}: {e}")
+                    deadlines.append(datetime.datetime.utcnow() + self.delay)
+            else:
+                deadlines.append(deadline)
+
+        return (min(deadlines) - datetime.datetime.utcnow()).total_seconds() if deadlines else None
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+
+        while self.bot.db is None:
+            await asyncio.sleep(5)
+
+        while not self.bot.is_closed():
+            self._wakeup.clear()
+
+            try:
+                timeout = await self._flush_due_channels()
+            except Exception as e:
+                # i.e. the database is briefly unavailable, try again in a minute instead of stopping for good
+                print(f"[BOT] Error while checking pending announcements: {e.__class__.__name__}: {e}")
+                timeout = 60
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+class LegislatureStatistics:
+    """Snapshot of the statistics shown in -legislature stats. It's loaded once and then kept up to date by the
+    commands that open sessions, submit, withdraw, pass and repeal bills or motions."""
+
+    def __init__(self, record: asyncpg.Record):
+        self.amount_of_sessions: int = record['sessions']
+        self.amount_of_bills: int = record['bills']
+        self.amount_of_laws: int = record['laws']
+        self.amount_of_motions: int = record['motions']
+        self.sessions_by_speaker = collections.Counter(dict(record['sessions_by_speaker'] or []))
+        self.bills_by_submitter = collections.Counter(dict(record['bills_by_submitter'] or []))
+        self.laws_by_submitter = collections.Counter(dict(record['laws_by_submitter'] or []))
+
+        # Name of a Counter -> its formatted top five, only rebuilt once that Counter changed
+        self._pretty: typing.Dict[str, str] = dict()
+
+    def get_pretty(self, counter_name: str, prettify: typing.Callable[[collections.Counter], str]) -> str:
+        """Returns prettify(counter), which is only called again after that Counter changed"""
+
+        if counter_name not in self._pretty:
+            self._pretty[counter_name] = prettify(getattr(self, counter_name))
+
+        return self._pretty[counter_name]
+
+    def session_opened(self, speaker: int):
+        self.amount_of_sessions += 1
+        self.sessions_by_speaker[speaker] += 1
+        self._pretty.pop('sessions_by_speaker', None)
+
+    def bill_submitted(self, submitter: int):
+        self.amount_of_bills += 1
+        self.bills_by_submitter[submitter] += 1
+        self._pretty.pop('bills_by_submitter', None)
+
+    def bill_withdrawn(self, submitter: int):
+        self.amount_of_bills -= 1
+        self.bills_by_submitter[submitter] -= 1
+        self._pretty.pop('bills_by_submitter', None)
+
+    def motion_submitted(self):
+        self.amount_of_motions += 1
+
+    def motion_withdrawn(self):
+        self.amount_of_motions -= 1
+
+    def laws_passed(self, submitters: typing.Iterable[int]):
+        for submitter in submitters:
+            self.amount_of_laws += 1
+            self.laws_by_submitter[submitter] += 1
+
+        self._pretty.pop('laws_by_submitter', None)
+
+    def laws_repealed(self, submitters: typing.Iterable[int]):
+        for submitter in submitters:
+            self.amount_of_laws -= 1
+            self.laws_by_submitter[submitter] -= 1
+
+        self._pretty.pop('laws_by_submitter', None)
 
 
 class LawUtils:
@@ -91,9 +363,40 @@ class LawUtils:
         self.illegal_tags = ('act', 'the', 'author', 'authors', 'date',
                              'name', 'bill', 'law', 'and', 'd/m/y', 'type', 'description')
 
-        # The natural language processor module nltk used for legislature_tags needs extra data to work
-        nltk.download('punkt')
-        nltk.download('averaged_perceptron_tagger')
+        # Sessions, bills, laws and motions of closed sessions rarely change, so they're kept in memory across commands
+        self.cache = LRUCache(maxsize=config.LEGISLATURE_CACHE_SIZE)
+
+        # Built once the database connection is ready, see build_search_index()
+        self.search_index: typing.Optional[LawSearchIndex] = None
+
+        # The tags of passed bills are generated in a separate process, see generate_law_tags_many()
+        self._process_pool = None
+
+        # Loaded by the first -legislature stats, see get_leg_statistics()
+        self.statistics: typing.Optional[LegislatureStatistics] = None
+
+    def invalidate(self, model: type, _id: int):
+        """Removes a session, bill, law or motion from the cache after it was changed or deleted in the database."""
+        self.cache.pop((model, _id))
+
+    def cache_info(self) -> CacheInfo:
+        return self.cache.cache_info()
+
+    async def build_search_index(self):
+        """Loads all active laws with their tags into the in-memory search index used by -law search"""
+
+        query = """SELECT l.law_id, b.bill_name, b.link, b.description,
+                   ARRAY(SELECT t.tag FROM legislature_tags t WHERE t.id = l.law_id) AS tags
+                   FROM legislature_laws l
+                   JOIN legislature_bills b ON b.id = l.bill_id"""
+
+        index = LawSearchIndex()
+
+        for record in await self.bot.db.fetch(query):
+            index.add(record['law_id'], record['bill_name'], record['link'], record['description'], record['tags'])
+
+        self.search_index = index
+        print(f"[BOT] Built search index with {len(index)} laws")
 
     @staticmethod
     def is_google_doc_link(link: str) -> bool:
@@ -107,19 +410,25 @@ class LawUtils:
         else:
             return True
 
-    async def get_active_leg_session(self) -> typing.Optional[Session]:
+    async def get_active_leg_session(self, ctx=None, prefetch: bool = False) -> typing.Optional[Session]:
+        """Returns the currently active session. Pass the command's Context to reuse a session that was
+        already loaded during that command."""
+
         law_id = await self.bot.db.fetchval("SELECT id FROM legislature_sessions WHERE is_active = true")
 
         if law_id is not None:
-            return await Session.convert(MockContext(self.bot), law_id)
+            return await Session.convert(ctx or MockContext(self.bot), law_id, prefetch=prefetch)
 
         return None
 
-    async def get_last_leg_session(self) -> typing.Optional[Session]:
+    async def get_last_leg_session(self, ctx=None, prefetch: bool = False) -> typing.Optional[Session]:
+        """Returns the most recent session. Pass the command's Context to reuse a session that was
+        already loaded during that command."""
+
         law_id = await self.bot.db.fetchval("SELECT MAX(id) FROM legislature_sessions")
 
         if law_id is not None:
-            return await Session.convert(MockContext(self.bot), law_id)
+            return await Session.convert(ctx or MockContext(self.bot), law_id, prefetch=prefetch)
 
         return None
 
@@ -165,23 +474,41 @@ class LawUtils:
     def generate_law_tags(self, google_docs_description: str, author_description: str) -> typing.List[str]:
         """Generates tags from all nouns of submitter-provided description and the Google Docs description"""
 
-        # Function to check if token is noun
-        is_noun = lambda pos: pos[:2] == 'NN'
+        return generate_law_tags(google_docs_description, author_description, self.illegal_tags)
+
+    @property
+    def process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        # A single worker process is enough since every pass operation sends all of its bills in one batch, and it
+        # keeps the nltk models loaded in between batches
+        if self._process_pool is None:
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+
+        return self._process_pool
 
-        # Tokenize both descriptions
-        tokenized_docs_description = nltk.word_tokenize(google_docs_description)
-        tokenized_author_description = nltk.word_tokenize(author_description)
+    async def generate_law_tags_many(self, bills: typing.List[Bill]) -> typing.List[typing.List[str]]:
+        """Generates the tags of many bills at once in a separate process, returns them in the same order as bills"""
 
-        # Add all nouns to list
-        tags = [word for (word, pos) in nltk.pos_tag(tokenized_docs_description) +
-                nltk.pos_tag(tokenized_author_description) if is_noun(pos) and
-                len(word) >= 3 and
-                word.lower() not in self.illegal_tags]
+        to_tag = [(bill.name, bill.google_docs_description, bill.description) for bill in bills]
+        return await self.bot.loop.run_in_executor(self.process_pool, generate_tags_for_bills, to_tag,
+                                                   self.illegal_tags)
 
-        # Eliminate duplicate tags
-        tags = list(set(tags))
+    async def add_law_tags(self, tags: typing.Dict[int, typing.List[str]], connection=None):
+        """Saves the tags of many laws with a single statement, tags is a dict of law ids and their tags"""
 
-        return tags
+        con = connection or self.bot.db
+        law_ids, law_tags = [], []
+
+        for law_id, _tags in tags.items():
+            for tag in _tags:
+                law_ids.append(law_id)
+                law_tags.append(tag.lower())
+
+        await con.execute("INSERT INTO legislature_tags (id, tag) SELECT * FROM unnest($1::int[], $2::text[])"
+                          " ON CONFLICT DO NOTHING", law_ids, law_tags)
+
+    def shutdown(self):
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
 
     @staticmethod
     def sort_dict_by_value(to_be_sorted: dict) -> dict:
@@ -192,36 +519,28 @@ class LawUtils:
 
         return to_be_sorted
 
-    @staticmethod
-    def count_rows_from_db_record(record: asyncpg.Record, record_key: str) -> dict:
-        """Converts a database asyncp.Record into a dict with Record keys as keys and their
-         amount of occurrence as value"""
-
-        record_as_list = []
-
-        for r in record:
-            record_as_list.append(r[record_key])
-
-        counter = collections.Counter(record_as_list)
-        return dict(counter)
-
-    def get_pretty_stats(self, to_be_pretty: dict, stats_name: str) -> str:
-        """Prettifies the dicts used in generate_leg_statistics() to strings"""
+    def get_pretty_stats(self, to_be_pretty: collections.Counter, stats_name: str) -> str:
+        """Prettifies the Counters of LegislatureStatistics to strings"""
 
         pretty = f""
         i = 1
 
-        for key, value in to_be_pretty.items():
-            if self.bot.get_user(key) is not None:
+        for key, value in to_be_pretty.most_common():
+            if value <= 0:
+                break
+
+            user = self.bot.get_user(key)
+
+            if user is not None:
                 if i > 5:
                     break
 
                 if value == 1:
                     # Singular stats_name
-                    pretty += f"{i}. {self.bot.get_user(key).mention} with {value} {stats_name[:-1]}\n"
+                    pretty += f"{i}. {user.mention} with {value} {stats_name[:-1]}\n"
                 else:
                     # Plural stats_name
-                    pretty += f"{i}. {self.bot.get_user(key).mention} with {value} {stats_name}\n"
+                    pretty += f"{i}. {user.mention} with {value} {stats_name}\n"
 
                 i += 1
 
@@ -230,46 +549,68 @@ class LawUtils:
 
         return pretty
 
+    async def get_leg_statistics(self) -> LegislatureStatistics:
+        """Returns the statistics snapshot, loading it with a single query the first time"""
+
+        if self.statistics is not None:
+            return self.statistics
+
+        query = """SELECT (SELECT COUNT(id) FROM legislature_sessions) AS sessions,
+                          (SELECT COUNT(id) FROM legislature_bills) AS bills,
+                          (SELECT COUNT(law_id) FROM legislature_laws) AS laws,
+                          (SELECT COUNT(id) FROM legislature_motions) AS motions,
+                          (SELECT array_agg(ARRAY[speaker, amount]) FROM
+                              (SELECT speaker, COUNT(*) AS amount FROM legislature_sessions
+                               GROUP BY speaker) s) AS sessions_by_speaker,
+                          (SELECT array_agg(ARRAY[submitter, amount]) FROM
+                              (SELECT submitter, COUNT(*) AS amount FROM legislature_bills
+                               GROUP BY submitter) b) AS bills_by_submitter,
+                          (SELECT array_agg(ARRAY[submitter, amount]) FROM
+                              (SELECT b.submitter, COUNT(*) AS amount FROM legislature_laws l
+                               JOIN legislature_bills b ON b.id = l.bill_id
+                               GROUP BY b.submitter) l) AS laws_by_submitter"""
+
+        self.statistics = LegislatureStatistics(await self.bot.db.fetchrow(query))
+        return self.statistics
+
     async def generate_leg_statistics(self) -> list:
         """Generates statistics for the -legislature stats command"""
 
-        # General total amount of things
-        amount_of_sessions = await self.bot.db.fetchval("SELECT COUNT(id) FROM legislature_sessions")
-        amount_of_bills = await self.bot.db.fetchval("SELECT COUNT(id) FROM legislature_bills")
-        amount_of_laws = await self.bot.db.fetchval("SELECT COUNT(law_id) FROM legislature_laws")
-        amount_of_motions = await self.bot.db.fetchval("SELECT COUNT(id) FROM legislature_motions")
-
-        # Sorted statistics by Discord Member
-        amount_of_bills_by_submitter = self.count_rows_from_db_record(await self.bot.db.fetch("SELECT submitter FROM "
-                                                                                              "legislature_bills"),
-                                                                      'submitter')
-        amount_of_sessions_by_speaker = self.count_rows_from_db_record(await self.bot.db.fetch("SELECT speaker FROM "
-                                                                                               "legislature_sessions"),
-                                                                       'speaker')
-        query = """SELECT submitter FROM legislature_bills AS b WHERE exists (SELECT 1 FROM legislature_laws l
-                   WHERE l.bill_id = b.id)"""
-        amount_of_laws_by_submitter = self.count_rows_from_db_record(await self.bot.db.fetch(query), 'submitter')
+        stats = await self.get_leg_statistics()
 
-        # Prettified sorted statistics by discord.Member
-        pretty_top_submitter = self.get_pretty_stats(self.sort_dict_by_value(amount_of_bills_by_submitter), 'bills')
+        # Prettified sorted statistics by discord.Member, cached by the snapshot until the underlying Counter changes
+        pretty_top_submitter = stats.get_pretty('bills_by_submitter',
+                                                lambda counter: self.get_pretty_stats(counter, 'bills'))
 
-        pretty_top_speaker = self.get_pretty_stats(self.sort_dict_by_value(amount_of_sessions_by_speaker), 'sessions')
+        pretty_top_speaker = stats.get_pretty('sessions_by_speaker',
+                                              lambda counter: self.get_pretty_stats(counter, 'sessions'))
 
-        pretty_top_lawmaker = self.get_pretty_stats(self.sort_dict_by_value(amount_of_laws_by_submitter), 'laws')
+        pretty_top_lawmaker = stats.get_pretty('laws_by_submitter',
+                                               lambda counter: self.get_pretty_stats(counter, 'laws'))
 
-        return [amount_of_sessions, amount_of_bills, amount_of_laws, amount_of_motions,
+        return [stats.amount_of_sessions, stats.amount_of_bills, stats.amount_of_laws, stats.amount_of_motions,
                 pretty_top_submitter, pretty_top_speaker, pretty_top_lawmaker]
 
-    async def post_to_hastebin(self, text: str) -> typing.Optional[str]:
-        """Post text to mystb.in"""
+    async def post_to_hastebin(self, text: typing.Union[str, typing.Iterable[str]]) -> typing.Optional[str]:
+        """Post text to mystb.in. Instead of a string, text can also be an iterable of lines, which are then streamed
+        to mystb.in while they're generated."""
 
-        async with self.bot.session.post("https://mystb.in/documents", data=text) as response:
-            if response.status == 200:
-                data = await response.json()
+        if isinstance(text, str):
+            data = text
+        else:
+            async def stream_lines(lines):
+                for line in lines:
+                    yield f"{line}\n".encode()
+
+            data = stream_lines(text)
+
+        async with self.bot.session.post("https://mystb.in/documents", data=data) as response:
+            if response.status != 200:
+                return None
 
             try:
-                key = data['key']
-            except KeyError:
+                key = (await response.json())['key']
+            except (KeyError, TypeError, aiohttp.ContentTypeError):
                 return None
 
         return f"https://mystb.in/{key}"
@@ -284,36 +625,10 @@ class LawUtils:
 
         return tiny_url
 
-    async def update_pg_trgm_similarity_threshold(self, threshold: float = 0.3, connection=None):
-        # I couldn't figure out how to make the setting persist in all sessions from the connection pool, so
-        # we just set it every time per connection
-
-        con = connection or self.bot.db
-        await con.execute(f"SET pg_trgm.similarity_threshold = {threshold}")
-
-    async def search_law_by_name(self, name: str, connection=None) -> typing.Dict[str, None]:
-        """Search for laws by their name, returns list with prettified strings of found laws"""
-
-        con = connection or self.bot.db
-
-        query = """SELECT law_id FROM legislature_laws AS l
-                   JOIN legislature_bills lb ON l.bill_id = lb.id
-                   WHERE lower(lb.bill_name) LIKE '%' || $1 || '%' 
-                   ORDER BY similarity(lower(lb.bill_name), $1) DESC
-                   LIMIT 10;"""
-
-        laws = await con.fetch(query, name.lower())
-
-        found = dict()
-
-        for law_id in laws:
-            law = await Law.convert(MockContext(self.bot), law_id['law_id'])
-            found[f"Law #{law.id} - [{law.bill.name}]({law.bill.link})"] = None
-
-        return found
-
-    async def search_law_by_tag(self, tag: str, connection=None) -> typing.Dict[str, None]:
-        """Search for laws by their tag(s), returns list with prettified strings of found laws"""
+    async def search_laws(self, query: str, tag_threshold: float = 0.4,
+                          limit: int = config.LEGISLATURE_SEARCH_LIMIT) -> typing.List[str]:
+        """Search for laws by their name, description and tags, returns list with prettified strings of the best
+        `limit` found laws, best matches first"""
 
         # Once a bill is passed into law, the bot automatically generates tags for it to allow for easier and faster
         # searching.
@@ -323,16 +638,52 @@ class LawUtils:
         # few sentences of content.) and tokenizes those with nltk. Then, every noun from both descriptions is saved
         # into the legislature_tags table with the corresponding law_id.
 
-        con = connection or self.bot.db
-
-        found_laws = await con.fetch("SELECT id FROM legislature_tags WHERE tag % $1 ORDER BY tag <-> $1",
-                                     tag.lower())
-
-        # Abuse dict as ordered set
-        pretty_laws = dict()
-
-        for law_id in found_laws:
-            law = await Law.convert(MockContext(self.bot), law_id['id'])
-            pretty_laws[f"Law #{law.id} - [{law.bill.name}]({law.bill.link})"] = None
-
-        return pretty_laws
+        # Every word of the query is scored against the name, description and tags of every law in a single statement,
+        # so the amount of words does not change the amount of round trips. Laws whose name contains the whole query
+        # are always listed first. The tag threshold is compared explicitly instead of changing the connection's
+        # pg_trgm.similarity_threshold. Each kind of match is looked up on its own with a trigram index (% for tags,
+        # LIKE for names and descriptions), and only the laws found that way are scored.
+
+        query = query.lower()
+        terms = list({word for word in query.split() if len(word) >= 3 and word not in self.illegal_tags})
+
+        if self.search_index is not None:
+            return [f"Law #{law.id} - [{law.name}]({law.link})"
+                    for law in self.search_index.search(query, terms, tag_threshold)[:limit]]
+
+        sql = """WITH tag_scores AS (
+                    SELECT id AS law_id, SUM(score) AS tag_score
+                    FROM (SELECT t.id, term, MAX(similarity(t.tag, term)) AS score
+                          FROM unnest($2::text[]) AS term
+                          JOIN legislature_tags t ON t.tag % term AND similarity(t.tag, term) >= $3
+                          GROUP BY t.id, term) best_tag_per_term
+                    GROUP BY id
+                 ), text_hits AS (
+                    SELECT l.law_id, COUNT(*) AS text_hits
+                    FROM unnest($2::text[]) AS term
+                    JOIN legislature_bills b ON lower(b.bill_name) LIKE '%' || term || '%'
+                                             OR lower(b.description) LIKE '%' || term || '%'
+                    JOIN legislature_laws l ON l.bill_id = b.id
+                    GROUP BY l.law_id
+                 ), name_matches AS (
+                    SELECT l.law_id
+                    FROM legislature_bills b
+                    JOIN legislature_laws l ON l.bill_id = b.id
+                    WHERE lower(b.bill_name) LIKE '%' || $1 || '%'
+                 )
+                 SELECT l.law_id, b.bill_name, b.link
+                 FROM (SELECT law_id FROM tag_scores
+                       UNION SELECT law_id FROM text_hits
+                       UNION SELECT law_id FROM name_matches) found
+                 JOIN legislature_laws l ON l.law_id = found.law_id
+                 JOIN legislature_bills b ON b.id = l.bill_id
+                 LEFT JOIN tag_scores ts ON ts.law_id = l.law_id
+                 LEFT JOIN text_hits th ON th.law_id = l.law_id
+                 ORDER BY lower(b.bill_name) LIKE '%' || $1 || '%' DESC,
+                          similarity(lower(b.bill_name), $1) + COALESCE(ts.tag_score, 0)
+                          + 0.5 * COALESCE(th.text_hits, 0) DESC,
+                          l.law_id
+                 LIMIT $4"""
+
+        laws = await self.bot.db.fetch(sql, query, terms, tag_threshold, limit)
+        return [f"Law #{law['law_id']} - [{law['bill_name']}]({law['link']})" for law in laws]
@@ -0,0 +1,91 @@
+import typing
+import asyncio
+import discord
+import traceback
+import collections
+
+ReactionCheck = typing.Callable[[discord.RawReactionActionEvent], bool]
+ReactionListener = typing.Callable[[discord.RawReactionActionEvent], typing.Awaitable[None]]
+
+
+class ReactionRouter:
+    """Dispatches raw reaction events only to whoever is interested in them. Waiters are indexed by message id and
+    listeners by (guild_id, emoji), so every reaction the bot sees costs a few dict lookups instead of running the
+    check of every pending bot.wait_for('reaction_add') call."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+        # message_id -> [(future, check, event)]
+        self._waiters: typing.Dict[int, list] = dict()
+
+        # (guild_id, emoji, event) -> [listener], a guild_id of None matches reactions in every guild
+        self._listeners: typing.Dict[tuple, typing.List[ReactionListener]] = collections.defaultdict(list)
+
+        self.bot.add_listener(self.on_raw_reaction_add)
+        self.bot.add_listener(self.on_raw_reaction_remove)
+
+    def add_listener(self, emoji: str, listener: ReactionListener, *, event: str = 'add', guild_id: int = None):
+        """Calls listener for every reaction with emoji that is added (or removed if event is 'remove')"""
+        self._listeners[(guild_id, emoji, event)].append(listener)
+
+    def remove_listener(self, emoji: str, listener: ReactionListener, *, event: str = 'add', guild_id: int = None):
+        listeners = self._listeners.get((guild_id, emoji, event))
+
+        if listeners and listener in listeners:
+            listeners.remove(listener)
+
+    async def wait_for(self, message_id: int, *, check: ReactionCheck = None, timeout: float = None,
+                       event: str = 'add') -> discord.RawReactionActionEvent:
+        """Waits for the first reaction on a message that passes check, like bot.wait_for('raw_reaction_add').
+
+        Raises asyncio.TimeoutError if there was none in time."""
+
+        future = self.bot.loop.create_future()
+        waiter = (future, check, event)
+        self._waiters.setdefault(message_id, []).append(waiter)
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            waiters = self._waiters.get(message_id)
+
+            if waiters is not None:
+                if waiter in waiters:
+                    waiters.remove(waiter)
+
+                if not waiters:
+                    del self._waiters[message_id]
+
+    async def _run_listener(self, listener: ReactionListener, payload: discord.RawReactionActionEvent):
+        try:
+            await listener(payload)
+        except Exception:
+            print(f"[BOT] Ignoring exception in reaction listener {listener.__qualname__}:")
+            traceback.print_exc()
+
+    def dispatch(self, event: str, payload: discord.RawReactionActionEvent):
+        for future, check, waiter_event in self._waiters.get(payload.message_id, ()):
+            if waiter_event != event or future.done():
+                continue
+
+            try:
+                result = check is None or check(payload)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+
+            if result:
+                future.set_result(payload)
+
+        emoji = str(payload.emoji)
+
+        for guild_id in {payload.guild_id, None}:
+            for listener in self._listeners.get((guild_id, emoji, event), ()):
+                self.bot.loop.create_task(self._run_listener(listener, payload))
+
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        self.dispatch('add', payload)
+
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        self.dispatch('remove', payload)
@@ -0,0 +1,175 @@
+import re
+import typing
+import collections
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: typing.Optional[str]) -> typing.List[str]:
+    """Splits text into lowercase words the same way pg_trgm does, i.e. every non-alphanumeric character is a
+    separator"""
+
+    if not text:
+        return []
+
+    return _WORD.findall(text.lower())
+
+
+def trigrams(text: typing.Optional[str]) -> typing.Set[str]:
+    """Returns the set of trigrams of text, padded like pg_trgm's show_trgm()"""
+
+    result = set()
+
+    for word in tokenize(text):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    return result
+
+
+def similarity(a: typing.Union[str, typing.Set[str]], b: typing.Union[str, typing.Set[str]]) -> float:
+    """Same as pg_trgm's similarity(), accepts either strings or already computed trigram sets"""
+
+    a = a if isinstance(a, set) else trigrams(a)
+    b = b if isinstance(b, set) else trigrams(b)
+
+    if not a or not b:
+        return 0.0
+
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+IndexedLaw = collections.namedtuple('IndexedLaw', ['id', 'name', 'link', 'tokens', 'tags'])
+
+
+class LawSearchIndex:
+    """In-memory inverted index of all active laws. Maps every word of a law's name and description to the law ids
+    it appears in, and every tag to its laws, with a trigram index over the tags for fuzzy matching.
+
+    Ranks results like LawUtils.search_laws() does in SQL, except that query words only count as a hit in a law's
+    name or description if they match a whole word there."""
+
+    def __init__(self):
+        self._laws: typing.Dict[int, IndexedLaw] = dict()
+        self._words: typing.Dict[str, typing.Set[int]] = collections.defaultdict(set)
+        self._tags: typing.Dict[str, typing.Set[int]] = collections.defaultdict(set)
+        self._tag_trigrams: typing.Dict[str, typing.Set[str]] = collections.defaultdict(set)
+
+    def __len__(self):
+        return len(self._laws)
+
+    def __contains__(self, law_id: int):
+        return law_id in self._laws
+
+    def add(self, law_id: int, name: str, link: str, description: typing.Optional[str],
+            tags: typing.Iterable[str] = ()):
+        if law_id in self._laws:
+            self.remove(law_id)
+
+        tokens = frozenset(tokenize(name) + tokenize(description))
+        self._laws[law_id] = IndexedLaw(law_id, name, link, tokens, set())
+
+        for token in tokens:
+            self._words[token].add(law_id)
+
+        self.add_tags(law_id, tags)
+
+    def add_tags(self, law_id: int, tags: typing.Iterable[str]):
+        law = self._laws.get(law_id)
+
+        if law is None:
+            return
+
+        for tag in tags:
+            tag = tag.lower()
+
+            if tag in law.tags:
+                continue
+
+            law.tags.add(tag)
+
+            if not self._tags[tag]:
+                for trigram in trigrams(tag):
+                    self._tag_trigrams[trigram].add(tag)
+
+            self._tags[tag].add(law_id)
+
+    def update_link(self, law_id: int, link: str):
+        law = self._laws.get(law_id)
+
+        if law is not None:
+            self._laws[law_id] = law._replace(link=link)
+
+    def remove(self, law_id: int):
+        law = self._laws.pop(law_id, None)
+
+        if law is None:
+            return
+
+        for token in law.tokens:
+            self._discard(self._words, token, law_id)
+
+        for tag in law.tags:
+            self._discard(self._tags, tag, law_id)
+
+            if tag not in self._tags:
+                for trigram in trigrams(tag):
+                    self._discard(self._tag_trigrams, trigram, tag)
+
+    @staticmethod
+    def _discard(postings: dict, key, value):
+        entries = postings.get(key)
+
+        if entries is None:
+            return
+
+        entries.discard(value)
+
+        if not entries:
+            del postings[key]
+
+    def _fuzzy_tag_scores(self, term: str, threshold: float) -> typing.Dict[int, float]:
+        """Returns the best tag similarity to term for every law that has a tag at least `threshold` similar"""
+
+        term_trigrams = trigrams(term)
+        candidates = set()
+
+        for trigram in term_trigrams:
+            candidates.update(self._tag_trigrams.get(trigram, ()))
+
+        scores = dict()
+
+        for tag in candidates:
+            score = similarity(term_trigrams, tag)
+
+            if score < threshold:
+                continue
+
+            for law_id in self._tags[tag]:
+                if score > scores.get(law_id, 0):
+                    scores[law_id] = score
+
+        return scores
+
+    def search(self, query: str, terms: typing.Iterable[str], tag_threshold: float = 0.4) -> typing.List[IndexedLaw]:
+        """Returns all laws whose name contains query, that have a tag similar to one of the terms or whose name or
+        description contains one of the terms, best matches first"""
+
+        query = query.lower()
+        tag_score = collections.Counter()
+        text_hits = collections.Counter()
+
+        for term in terms:
+            tag_score.update(self._fuzzy_tag_scores(term, tag_threshold))
+            text_hits.update(self._words.get(term, ()))
+
+        name_matches = {law.id for law in self._laws.values() if query in law.name.lower()}
+        query_trigrams = trigrams(query)
+
+        def rank(law_id: int):
+            score = similarity(query_trigrams, self._laws[law_id].name) + tag_score[law_id] + 0.5 * text_hits[law_id]
+            return law_id not in name_matches, -score, law_id
+
+        found = name_matches.union(tag_score, text_hits)
+        return [self._laws[law_id] for law_id in sorted(found, key=rank)]
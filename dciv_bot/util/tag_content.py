@@ -0,0 +1,48 @@
+import re
+import enum
+
+_EMOJI_PATTERN = re.compile(r"<(?P<animated>a)?:(?P<name>[0-9a-zA-Z_]{2,32}):(?P<id>[0-9]{15,21})>")
+_DISCORD_INVITE_PATTERN = re.compile(r"(?:https?://)?discord(?:app\.com/invite|\.gg)/?[a-zA-Z0-9]+/?")
+_URL_PATTERN = re.compile(
+    r"((http|https)\:\/\/)?[a-zA-Z0-9\.\/\?\:@\-_=#]+\.([a-zA-Z]){2,6}([a-zA-Z0-9\.\&\/\?\:@\-_=#])*")
+
+_URL_ENDINGS_IMAGE = ('.jpeg', '.jpg', '.png', '.gif', '.webp', '.bmp', '.img', '.svg')
+_URL_ENDINGS_VIDEO = ('.avi', '.mp4', '.mp3', '.mov', '.flv', '.wmv')
+_EMBEDDED_MEDIA_SITES = ('youtube', 'youtu.be', 'tenor.com', 'gph.is', 'giphy.com')
+
+
+class TagContentType(enum.Enum):
+    TEXT = 1
+    IMAGE = 2
+    INVITE = 3
+    CUSTOM_EMOJI = 4
+    YOUTUBE_TENOR_GIPHY = 5
+    VIDEO = 6
+    PARTIAL_IMAGE = 7
+
+
+def get_tag_content_type(tag_content: str) -> TagContentType:
+    """Classifies the content of a tag. The result is saved in guild_tags.content_type when a tag is added or edited,
+    so this only runs once per tag and not every time it's invoked."""
+
+    lowered = tag_content.lower()
+
+    if _URL_PATTERN.fullmatch(tag_content) and lowered.endswith(_URL_ENDINGS_IMAGE):
+        return TagContentType.IMAGE
+
+    elif _URL_PATTERN.match(tag_content) and lowered.endswith(_URL_ENDINGS_IMAGE):
+        return TagContentType.PARTIAL_IMAGE
+
+    elif _URL_PATTERN.match(tag_content) and lowered.endswith(_URL_ENDINGS_VIDEO):
+        return TagContentType.VIDEO
+
+    elif any(s in tag_content for s in _EMBEDDED_MEDIA_SITES):
+        return TagContentType.YOUTUBE_TENOR_GIPHY
+
+    elif _EMOJI_PATTERN.fullmatch(tag_content):
+        return TagContentType.CUSTOM_EMOJI
+
+    elif _DISCORD_INVITE_PATTERN.match(tag_content):
+        return TagContentType.INVITE
+
+    return TagContentType.TEXT
@@ -140,21 +140,20 @@ class CheckUtils:
 
         return check
 
-    def wait_for_reaction_check(self, ctx, original_message: discord.Message):
-        """Wrapper function for a client.wait_for('reaction_add') check"""
+    def wait_for_reaction_check(self, ctx):
+        """Wrapper function for a bot.reactions.wait_for() check"""
 
-        def check(reaction, user):
-            return user == ctx.author and reaction.message.id == original_message.id
+        def check(payload):
+            return payload.user_id == ctx.author.id
 
         return check
 
-    def wait_for_specific_emoji_reaction_check(self, ctx, original_message: discord.Message, emoji):
-        """Wrapper function for a client.wait_for('reaction_add') check.
+    def wait_for_specific_emoji_reaction_check(self, ctx, emoji):
+        """Wrapper function for a bot.reactions.wait_for() check.
             Also checks if reaction.emoji == ⚙"""
 
-        def check(reaction, user):
-            return user == ctx.author and reaction.message.id == original_message.id \
-                   and str(reaction.emoji) == emoji
+        def check(payload):
+            return payload.user_id == ctx.author.id and str(payload.emoji) == emoji
 
         return check
 